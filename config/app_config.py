@@ -6,6 +6,7 @@ This file is the single source of truth for all application-level configuration,
 including paths, constants, and navigation structure.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 import flet as ft
@@ -109,15 +110,23 @@ SPECIAL_PAGES = {
     "help": {"view_name": "HelpView"},
 }
 
+# Every routable page name mapped to the name of its view class
+PAGE_TO_VIEWNAME = {
+    **{page["name"]: page["view_name"] for page in PAGES},
+    **{name: data["view_name"] for name, data in SPECIAL_PAGES.items()},
+}
+
 
 
 # =============================================================================
 # Country-Based Source Mapping Configuration
 # =============================================================================
 
+@lru_cache(maxsize=64)
 def get_country_from_project_path(project_path: Path) -> str:
     """
     Extract the country name from a project path structure.
+    The result depends only on the path, so it is cached per path.
 
     The expected structure is:
         {BASE_DIR}/Directory_Source_Citations/{REGION}/{COUNTRY}/{BE_PREFIX}/{BE_FOLDER}/{PROJECT}/...
@@ -1,8 +1,10 @@
 """
 Logging configuration for the Source Manager application.
 """
+import asyncio
 import logging
 import logging.handlers
+import os
 from pathlib import Path
 # We only import the LOGS_DIR path, which is a core path setting.
 from config.app_config import LOGS_DIR
@@ -11,6 +13,11 @@ from config.app_config import LOGS_DIR
 LOG_LEVEL = "DEBUG"  # Set the default logging level (e.g., "DEBUG", "INFO", "WARNING")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# Set this environment variable to "1" to log event loop callbacks that block the UI
+PROFILE_ENV_VAR = "SOURCE_MANAGER_PROFILE"
+# Callbacks running longer than this many seconds are logged when profiling
+SLOW_CALLBACK_SECONDS = 0.05
+
 def setup_logging():
     """
     Sets up application-wide logging. This should be called once
@@ -64,3 +71,29 @@ def setup_logging():
     
     logging.info("Logging configured successfully.")
 
+
+class _MonitoredEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """Creates event loops in debug mode, which log every callback slower than SLOW_CALLBACK_SECONDS."""
+
+    def new_event_loop(self):
+        loop = super().new_event_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = SLOW_CALLBACK_SECONDS
+        return loop
+
+
+def setup_loop_monitoring():
+    """
+    Enables slow-callback logging for the event loop Flet runs the UI on, if the
+    SOURCE_MANAGER_PROFILE environment variable is set to "1". asyncio then logs a
+    warning naming each handler that blocked the loop, with how long it ran.
+    Must be called before the app starts its event loop.
+    """
+    if os.environ.get(PROFILE_ENV_VAR) != "1":
+        return
+    asyncio.set_event_loop_policy(_MonitoredEventLoopPolicy())
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+    logging.info(
+        "Event loop monitoring enabled; callbacks over %.0f ms will be logged.",
+        SLOW_CALLBACK_SECONDS * 1000,
+    )
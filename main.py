@@ -3,10 +3,11 @@ Source Manager Application Entry Point
 """
 import flet as ft
 import logging
-from config.logging_config import setup_logging
+from config.logging_config import setup_logging, setup_loop_monitoring
 
 
 setup_logging()
+setup_loop_monitoring()
 # --- Import Application Components ---
 from src.controllers.app_controller import AppController
 from config.app_config import (
@@ -33,32 +34,38 @@ def main(page: ft.Page):
     # --- Initialize and Run Application ---
     try:
         controller = AppController(page)
-        controller.run()
+        # Failures during the asynchronous part of startup land on the same screen
+        controller.run(on_startup_error=lambda e: show_startup_error(page))
     except Exception as e:
         logger.critical(f"A critical error occurred during application startup: {e}", exc_info=True)
-        # Display a simple error message
-        page.clean()
-        page.add(
-            ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Icon(ft.icons.ERROR_OUTLINE, color="red", size=48),
-                        ft.Text("Application Startup Failed", size=24, weight=ft.FontWeight.BOLD),
-                        ft.Text(
-                            "A critical error occurred. Please check the logs for details.",
-                            text_align=ft.TextAlign.CENTER,
-                            color=ft.colors.ON_SURFACE_VARIANT
-                        ),
-                    ],
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=15,
-                ),
-                alignment=ft.alignment.center,
-                expand=True,
-                padding=20
-            )
+        show_startup_error(page)
+
+
+def show_startup_error(page: ft.Page):
+    """Replaces the page content with a simple startup error message."""
+    page.clean()
+    page.add(
+        ft.Container(
+            content=ft.Column(
+                [
+                    ft.Icon(ft.icons.ERROR_OUTLINE, color="red", size=48),
+                    ft.Text("Application Startup Failed", size=24, weight=ft.FontWeight.BOLD),
+                    ft.Text(
+                        "A critical error occurred. Please check the logs for details.",
+                        text_align=ft.TextAlign.CENTER,
+                        color=ft.colors.ON_SURFACE_VARIANT
+                    ),
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=15,
+            ),
+            alignment=ft.alignment.center,
+            expand=True,
+            padding=20
         )
-        page.update()
+    )
+    page.update()
+
 
 if __name__ == "__main__":
     ft.app(target=main)
@@ -4,10 +4,14 @@ Batch migration script for processing 150 projects from old format to new format
 Processes files from the old directory and saves them to the reformatted directory.
 """
 
+import itertools
 import json
+import os
+import queue
 import sys
 from pathlib import Path
 import logging
+import logging.handlers
 
 # Add the root directory to Python path so we can import our services
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,17 +19,49 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.services.migration_service import MigrationService
 
 
-def setup_logging():
-    """Set up logging configuration."""
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Set up logging configuration.
+
+    Records are pushed onto a queue and written to the file and console by a
+    background listener, so handler I/O does not stall the migration loop.
+
+    Returns:
+        The started QueueListener; call stop() on it to flush pending records.
+    """
+    log_queue = queue.Queue(-1)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    file_handler = logging.FileHandler('migration.log')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('migration.log'),
-            logging.StreamHandler()
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
 
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    return listener
+
+
+def iter_json_files(directory: Path):
+    """
+    Lazily yields the JSON files in a directory.
+
+    Args:
+        directory: The directory to scan (non-recursive).
+
+    Yields:
+        os.DirEntry objects for each regular file ending in '.json'.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith('.json') and entry.is_file():
+                yield entry
+
 
 def batch_migrate_projects():
     """
@@ -48,21 +84,23 @@ def batch_migrate_projects():
         logger.error(f"Source directory does not exist: {old_dir}")
         return False
     
-    # Find all JSON files in old directory
-    json_files = list(old_dir.glob("*.json"))
+    # Stream the JSON files in the old directory, peeking at the first one so
+    # an empty directory can bail out without buffering the whole listing
+    json_files = iter_json_files(old_dir)
+    first_file = next(json_files, None)
     
-    if not json_files:
+    if first_file is None:
         logger.warning(f"No JSON files found in {old_dir}")
         return False
     
-    logger.info(f"Found {len(json_files)} JSON files to migrate")
+    logger.info(f"Found JSON files to migrate in {old_dir}")
     
     # Track results
     successful_migrations = 0
     failed_migrations = 0
     migration_results = {}
     
-    for json_file in json_files:
+    for json_file in itertools.chain([first_file], json_files):
         try:
             logger.info(f"Processing: {json_file.name}")
             
@@ -90,7 +128,7 @@ def batch_migrate_projects():
             migration_results[json_file.name] = False
     
     # Print summary
-    total_files = len(json_files)
+    total_files = successful_migrations + failed_migrations
     logger.info("=" * 60)
     logger.info("MIGRATION SUMMARY")
     logger.info("=" * 60)
@@ -112,19 +150,23 @@ def batch_migrate_projects():
 
 def main():
     """Main function."""
-    setup_logging()
+    listener = setup_logging()
     
     logger = logging.getLogger(__name__)
     logger.info("Starting batch project migration...")
     
-    success = batch_migrate_projects()
+    try:
+        success = batch_migrate_projects()
     
-    if success:
-        logger.info("🎉 All projects migrated successfully!")
-        sys.exit(0)
-    else:
-        logger.error("⚠️  Some projects failed to migrate. Check the log for details.")
-        sys.exit(1)
+        if success:
+            logger.info("🎉 All projects migrated successfully!")
+        else:
+            logger.error("⚠️  Some projects failed to migrate. Check the log for details.")
+    finally:
+        # Flush any queued records before the process exits
+        listener.stop()
+
+    sys.exit(0 if success else 1)
 
 
 if __name__ == "__main__":
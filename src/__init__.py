@@ -1,23 +1,16 @@
 """
 Source Manager Application Package
-Sets up clean imports for all modules
+Exposes the subpackages lazily so importing one module does not load the rest
 """
-import sys
-from pathlib import Path
+from utils.lazy_imports import lazy_exports
 
-# Add the src directory to Python path
-src_dir = Path(__file__).parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+_SUBPACKAGES = {
+    name: f".{name}" for name in ("controllers", "managers", "models", "services", "views")
+}
 
-# Import and expose all submodules
-from . import controllers
-from . import models
-from . import services
-from . import views
+# Imports a subpackage on first attribute access (PEP 562)
+__getattr__, __dir__ = lazy_exports(
+    __name__, globals(), _SUBPACKAGES, import_modules=True
+)
 
-# Also expose the classes directly for clean imports
-from .controllers import *
-from .models import *
-from .services import *
-from .views import *
\ No newline at end of file
+__all__ = sorted(_SUBPACKAGES)
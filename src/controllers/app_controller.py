@@ -1,6 +1,11 @@
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
 import flet as ft
-from typing import Dict, Optional
 
 # Import the services that handle all data operations
 from src.services.project_service import ProjectService
@@ -11,10 +16,8 @@ from src.services.source_service import SourceService
 from src.managers.user_config_manager import UserConfigManager
 from src.managers.navigation_manager import NavigationManager
 from src.managers.project_state_manager import ProjectStateManager
-from src.managers.project_browser_manager import ProjectBrowserManager
 from src.managers.theme_manager import ThemeManager
 from src.managers.settings_manager import SettingsManager
-from src.managers.powerpoint_manager import PowerPointManager
 
 # Import necessary views
 from src.views.main_view import MainView
@@ -28,6 +31,78 @@ from .powerpoint_controller import PowerPointController
 from .navigation_controller import NavigationController
 from .settings_controller import SettingsController
 
+if TYPE_CHECKING:
+    from src.managers.project_browser_manager import ProjectBrowserManager
+
+logger = logging.getLogger(__name__)
+
+# Pages the user is likely to open right after home; preloaded once it is shown
+WARM_CACHE_PAGES = ("recent_projects", "new_project")
+
+# Pages usually visited right after a project opens; constructed in the background then
+PROJECT_PREFETCH_PAGES = ("sources", "reports")
+
+# Most view instances kept alive at once; the least recently used is dropped first
+VIEW_CACHE_SIZE = 8
+
+
+class _ViewCache:
+    """
+    A small LRU cache of view instances keyed by page name.
+
+    Views are created on demand by the factory, and invalidate() is the single
+    way to discard one so it is rebuilt on the next visit.
+    """
+
+    def __init__(self, factory: Callable[[str], Optional[BaseView]], maxsize: int = VIEW_CACHE_SIZE):
+        self._factory = factory
+        self._views: "OrderedDict[str, BaseView]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def __contains__(self, page_name: str) -> bool:
+        return page_name in self._views
+
+    def get(self, page_name: str) -> Optional[BaseView]:
+        """Returns the cached view for a page, or None if it has not been created."""
+        view = self._views.get(page_name)
+        if view is not None:
+            self._views.move_to_end(page_name)
+        return view
+
+    def get_or_create(self, page_name: str) -> Optional[BaseView]:
+        """Returns the cached view for a page, creating it with the factory on a miss."""
+        view = self.get(page_name)
+        if view is None:
+            view = self._factory(page_name)
+            if view is not None:
+                self._views[page_name] = view
+                if len(self._views) > self._maxsize:
+                    self._views.popitem(last=False)
+        return view
+
+    def invalidate(self, page_name: str):
+        """Discards the cached view for a page, if any."""
+        self._views.pop(page_name, None)
+
+    def values(self):
+        """Returns the cached view instances."""
+        return self._views.values()
+
+
+class _BatchState(threading.local):
+    """
+    batched_update() state for one thread. Handlers, timers and worker threads
+    each get their own, so only the thread that opened a batch defers its updates.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.update_pending = False
+        # Pages whose update_view() was requested inside the batch, in request order
+        self.refresh_pending: Dict[str, None] = {}
+        # Set while an error is showing in the SnackBar but not yet sent to the client
+        self.error_pending = False
+
 
 class AppController:
     """
@@ -36,6 +111,36 @@ class AppController:
     It holds instances of specialized controllers to delegate tasks.
     """
 
+    __slots__ = (
+        "page",
+        # Services
+        "directory_service",
+        "source_service",
+        "project_service",
+        # Managers
+        "user_config_manager",
+        "navigation_manager",
+        "project_state_manager",
+        "_project_browser_manager",
+        "theme_manager",
+        "settings_manager",
+        "_powerpoint_manager",
+        # Sub controllers
+        "project_controller",
+        "source_controller",
+        "dialog_controller",
+        "powerpoint_controller",
+        "navigation_controller",
+        "settings_controller",
+        # Views
+        "main_view",
+        "views",
+        "_batch",
+        "_snack_text",
+        "_snack_bar",
+        "_snack_lock",
+    )
+
     def __init__(self, page: ft.Page):
         """
         Initializes the AppController.
@@ -43,11 +148,9 @@ class AppController:
         Args:
             page (ft.Page): The Flet page object.
         """
-        logging.info("Initializing AppController")
+        logger.info("Initializing AppController")
         self.page = page
         self.page.title = "Source Manager"
-        self.logger = logging.getLogger(__name__)
-        self.logger.info("Initializing AppController")
 
         # Initialize services
         self.directory_service = DirectoryService()
@@ -58,10 +161,11 @@ class AppController:
         self.user_config_manager = UserConfigManager()
         self.navigation_manager = NavigationManager()
         self.project_state_manager = ProjectStateManager()
-        self.project_browser_manager = ProjectBrowserManager(controller=self)
         self.theme_manager = ThemeManager()
-        self.settings_manager = SettingsManager()
-        self.powerpoint_manager = PowerPointManager(controller=self)
+        self.settings_manager = SettingsManager(self.user_config_manager)
+        # Created on first use; see the properties below
+        self._project_browser_manager: Optional["ProjectBrowserManager"] = None
+        self._powerpoint_manager = None
 
         # Setup sub controllers
         self.project_controller = ProjectController(self)
@@ -73,49 +177,229 @@ class AppController:
 
         # Initialize views
         self.main_view = MainView(controller=self, page=page)
-        self.views: Dict[str, BaseView] = {}
-        self._view_class_map = self.navigation_controller.build_view_class_map()
-        logging.info("AppController initialized successfully")
-
-    def run(self):
-        """Starts the application's main loop."""
-        # Apply theme
-        theme_mode = self.settings_manager.get_theme_mode()
-        theme_color = self.settings_manager.get_theme_color()
-        self.theme_manager.set_theme_mode(theme_mode)
-        self.theme_manager.set_theme_color(theme_color)
-    
-        self.settings_controller.apply_theme()
-        self.main_view.show()
-        if self.settings_manager.needs_setup():
-            self.dialog_controller.show_first_time_setup()
-        else:
-            self.navigate_to("home")
+        self.views = _ViewCache(self._create_view_for_page)
+        self._batch = _BatchState()
+
+        # One SnackBar is shared by every message instead of adding a new one to the overlay each time
+        self._snack_text = ft.Text("")
+        self._snack_bar = ft.SnackBar(content=self._snack_text)
+        self.page.overlay.append(self._snack_bar)
+        # Messages can come from any thread; each one sets text and color together
+        self._snack_lock = threading.Lock()
+        logger.info("AppController initialized successfully")
+
+    @property
+    def project_browser_manager(self) -> "ProjectBrowserManager":
+        """The project browser state, created (and its module imported) on first use since it scans the project folders."""
+        if self._project_browser_manager is None:
+            from src.managers.project_browser_manager import ProjectBrowserManager
+
+            self._project_browser_manager = ProjectBrowserManager(controller=self)
+        return self._project_browser_manager
+
+    @property
+    def powerpoint_manager(self):
+        """The PowerPoint reader, created (and python-pptx imported) only when slides are first needed."""
+        if self._powerpoint_manager is None:
+            from src.managers.powerpoint_manager import PowerPointManager
+
+            self._powerpoint_manager = PowerPointManager(controller=self)
+        return self._powerpoint_manager
+
+    async def initialize(self):
+        """
+        Loads the on-disk state the managers need before the UI is shown.
+        The user config is read off the UI thread; SettingsManager shares it.
+        """
+        await asyncio.to_thread(self.user_config_manager.load)
+
+    def run(self, on_startup_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Starts the application by scheduling startup on the page's event loop.
+
+        Args:
+            on_startup_error (callable, optional): Called with the exception if startup
+                fails, so the caller can show its error screen. Startup stops there.
+        """
+        self.page.run_task(self._start, on_startup_error)
+
+    async def _start(self, on_startup_error: Optional[Callable[[Exception], None]] = None):
+        """Loads the user config, applies the theme and shows the first page."""
+        try:
+            # An unreadable config must stop startup; carrying on with defaults
+            # would offer first-time setup and overwrite the user's config
+            await self.initialize()
+
+            # Apply theme
+            theme_mode = self.settings_manager.get_theme_mode()
+            theme_color = self.settings_manager.get_theme_color()
+            self.theme_manager.set_theme_mode(theme_mode)
+            self.theme_manager.set_theme_color(theme_color)
+
+            self.settings_controller.apply_theme()
+            self.main_view.update_greeting()
+            self.main_view.show()
+            first_run = self.settings_manager.needs_setup()
+            if first_run:
+                self.dialog_controller.show_first_time_setup()
+            else:
+                self.navigate_to("home")
+        except Exception as e:
+            logger.critical("Application startup failed: %s", e, exc_info=True)
+            if on_startup_error is not None:
+                on_startup_error(e)
+            return
+
+        if not first_run:
+            await self._warm_cache()
+
+    async def _warm_cache(self):
+        """
+        Imports and constructs the views in WARM_CACHE_PAGES while the user looks at home,
+        so the first click on them does not pay for it. Views are only constructed, not built.
+        The remaining view and dialog modules are then imported in the background.
+        """
+        for page_name in WARM_CACHE_PAGES:
+            if page_name in self.views:
+                continue
+            try:
+                # Import the module off the UI thread; construction then only instantiates
+                await asyncio.to_thread(
+                    self.navigation_controller.get_view_class, page_name
+                )
+                if page_name == "new_project":
+                    # Its view reads the browser manager, whose folder scan must not block the UI loop
+                    await asyncio.to_thread(getattr, self, "project_browser_manager")
+                self.views.get_or_create(page_name)
+            except Exception as e:
+                logger.warning("Could not preload view '%s': %s", page_name, e)
+
+        try:
+            # The rest of the views and the dialogs are only imported, not constructed
+            await asyncio.to_thread(self._preload_modules)
+        except Exception as e:
+            logger.warning("Could not preload view and dialog modules: %s", e)
+
+    async def prefetch_project_views(self, project):
+        """
+        Constructs the views in PROJECT_PREFETCH_PAGES after a project has opened, and
+        loads the master source library they list, so the next click finds them warm.
+        Stops early if a different project (or none) is loaded in the meantime.
+        """
+        # Let the dashboard render first
+        await asyncio.sleep(0)
+        try:
+            await asyncio.to_thread(self.source_service.get_all_master_sources)
+        except Exception as e:
+            logger.warning("Could not preload master sources: %s", e)
+
+        for page_name in PROJECT_PREFETCH_PAGES:
+            if self.project_state_manager.current_project is not project:
+                logger.debug("Project changed; stopping view prefetch")
+                return
+            if page_name in self.views:
+                continue
+            try:
+                self.views.get_or_create(page_name)
+            except Exception as e:
+                logger.warning("Could not prefetch view '%s': %s", page_name, e)
+
+    def _preload_modules(self):
+        """Imports every view and dialog module. Runs on a worker thread."""
+        from src.views.components import dialogs
+
+        self.navigation_controller.preload_view_classes()
+        dialogs.preload()
 
     def navigate_to(self, page_name: str, force_refresh: bool = False):
         """Handles navigation requests from any part of the UI."""
+        # Every routable page name; anything else is rejected up front
+        if page_name not in NavigationController.known_pages():
+            logger.error("Unknown page requested: '%s'", page_name)
+            return
+
         if force_refresh and page_name in self.views:
-            self.logger.info(f"Forcing refresh for view: '{page_name}'")
-            del self.views[page_name]
+            logger.info("Forcing refresh for view: '%s'", page_name)
+            self.views.invalidate(page_name)
 
-        self.logger.info(f"Navigation requested for '{page_name}'...")
+        logger.info("Navigation requested for '%s'...", page_name)
         self.navigation_controller.navigate_to_page(page_name)
 
+    @contextmanager
+    def batched_update(self):
+        """
+        Groups page updates into one round-trip to the Flet client.
+        update_page() calls made inside the block are deferred, and a single
+        page.update() is sent when the outermost block exits. View refreshes
+        requested with update_view() are also deferred, and each page is
+        refreshed once however many changes asked for it.
+        The batch belongs to the calling thread; updates from other threads
+        are sent as usual.
+        """
+        batch = self._batch
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            try:
+                if batch.depth == 1:
+                    # Run the queued refreshes while page updates are still deferred
+                    while batch.refresh_pending:
+                        page_name = next(iter(batch.refresh_pending))
+                        del batch.refresh_pending[page_name]
+                        self._refresh_view(page_name)
+            finally:
+                batch.depth -= 1
+                if batch.depth == 0:
+                    batch.error_pending = False
+                    if batch.update_pending:
+                        batch.update_pending = False
+                        self.page.update()
+
+    def update_page(self):
+        """Updates the page now, or at the end of this thread's enclosing batched_update() block."""
+        batch = self._batch
+        if batch.depth:
+            batch.update_pending = True
+        else:
+            self.page.update()
+
+    def _flash(self, message: str, bgcolor: Optional[str], is_error: bool = False):
+        """
+        Shows a message in the shared SnackBar with the given background color.
+        Inside a batched_update() block only the last message reaches the client,
+        so once an error is queued, later non-error messages in the block are dropped.
+        """
+        batch = self._batch
+        if batch.depth:
+            if batch.error_pending and not is_error:
+                return
+            batch.error_pending = is_error
+        with self._snack_lock:
+            if self._snack_bar.open and self._snack_bar.page is not None:
+                # Setting open on a bar that is already open sends no change, so the
+                # client would not show it again; close it first, then reopen
+                self._snack_bar.open = False
+                self._snack_bar.update()
+            self._snack_text.value = message
+            self._snack_bar.bgcolor = bgcolor
+            self._snack_bar.open = True
+        self.update_page()
+
     def show_success_message(self, message):
         """Displays a success message to the user using a SnackBar."""
-        logging.info(message)
-        snack_bar = ft.SnackBar(ft.Text(message), bgcolor=ft.colors.GREEN)
-        self.page.overlay.append(snack_bar)
-        snack_bar.open = True
-        self.page.update()
+        logger.info(message)
+        self._flash(message, ft.colors.GREEN)
 
     def show_error_message(self, message):
         """Displays an error message to the user using a SnackBar."""
-        logging.error(message)
-        snack_bar = ft.SnackBar(ft.Text(message), bgcolor=ft.colors.RED)
-        self.page.overlay.append(snack_bar)
-        snack_bar.open = True
-        self.page.update()
+        logger.error(message)
+        self._flash(message, ft.colors.RED, is_error=True)
+
+    def show_info_message(self, message):
+        """Displays a neutral message to the user using a SnackBar in the theme's colors."""
+        logger.info(message)
+        self._flash(message, None)
 
     def update_view(self, page_name: Optional[str] = None):
         """
@@ -125,6 +409,9 @@ class AppController:
         currently active view and tells it to refresh its own state. This is more
         efficient than a full page redraw.
 
+        Inside a batched_update() block the refresh is queued and runs once
+        when the block exits.
+
         Args:
             page_name (str, optional): The name of the page to update.
                                      If None, defaults to the current page.
@@ -132,31 +419,50 @@ class AppController:
         if page_name is None:
             page_name = self.navigation_manager.get_current_page()
 
-        self.logger.info(f"Update requested for view: '{page_name}'")
+        logger.info("Update requested for view: '%s'", page_name)
+        batch = self._batch
+        if batch.depth:
+            batch.refresh_pending[page_name] = None
+        else:
+            self._refresh_view(page_name)
 
+    def _refresh_view(self, page_name: str):
+        """Calls update_view() on the cached view for a page, if it exists."""
         # Check if the view instance exists in our cache
-        if page_name in self.views:
-            view_instance = self.views[page_name]
-
-            # Safely check if the view instance has an `update_view` method
-            if hasattr(view_instance, "update_view") and callable(
-                view_instance.update_view
-            ):
-                self.logger.debug(
-                    f"Calling update_view() on instance of {type(view_instance).__name__}."
+        view_instance = self.views.get(page_name)
+        if view_instance is not None:
+            # Every BaseView provides update_view(); anything else gets a plain page update
+            if isinstance(view_instance, BaseView):
+                logger.debug(
+                    "Calling update_view() on instance of %s.", type(view_instance).__name__
                 )
                 view_instance.update_view()
             else:
                 # If the view has no specific update logic, just do a generic page update.
-                self.logger.debug(
-                    f"View '{page_name}' has no update_view() method. Performing generic page update."
+                logger.debug(
+                    "View '%s' is not a BaseView. Performing generic page update.", page_name
                 )
-                self.page.update()
+                self.update_page()
         else:
-            self.logger.warning(
-                f"No view instance found for page '{page_name}' to update. A full navigation might be needed."
+            logger.warning(
+                "No view instance found for page '%s' to update. A full navigation might be needed.", page_name
             )
 
+    def _create_view_for_page(self, page_name: str) -> Optional[BaseView]:
+        """
+        Factory for the view cache: instantiates the view class for a page.
+
+        Args:
+            page_name (str): The name of the page.
+
+        Returns:
+            Optional[BaseView]: A new view instance, or None if the page has no view.
+        """
+        view_class = self.navigation_controller.get_view_class(page_name)
+        if view_class is None:
+            return None
+        return view_class(self.page, self)
+
     def clear_project_dependent_view_cache(self):
         """
         Clears cached views that depend on a loaded project.
@@ -165,9 +471,9 @@ class AppController:
         It removes views like 'ProjectView' from the cache, forcing them to be
         rebuilt with fresh data on the next navigation.
         """
-        self.logger.info("Clearing project-dependent view cache...")
+        logger.info("Clearing project-dependent view cache...")
         views_to_clear = ["project_dashboard", "project_view"]
         for view_name in views_to_clear:
             if view_name in self.views:
-                del self.views[view_name]
-                self.logger.debug(f"Removed '{view_name}' from view cache.")
\ No newline at end of file
+                self.views.invalidate(view_name)
+                logger.debug("Removed '%s' from view cache.", view_name)
\ No newline at end of file
@@ -1,17 +1,13 @@
+import asyncio
 from pathlib import Path
 from typing import Callable, Optional, Dict, Any, TYPE_CHECKING
 
 import flet as ft
 
 from .base_controller import BaseController
-from src.views.components.dialogs import (
-    ProjectCreationDialog,
-    AddSourceToProjectDialog,
-    SourceCreationDialog,
-    SourceEditorDialog,
-    FirstTimeSetupDialog,
-    FolderCreationDialog,
-)
+
+# Dialog classes are imported inside the methods that show them, so their
+# modules are only loaded once the user actually opens that dialog.
 
 if TYPE_CHECKING:
     from src.models.source_models import SourceRecord
@@ -34,7 +30,7 @@ class DialogController(BaseController):
         """
         self.controller.page.overlay.append(dialog)
         dialog.open = True
-        self.controller.page.update()
+        self.controller.update_page()
 
     def open_folder_creation_dialog(self, parent_path: Path):
         """
@@ -47,22 +43,30 @@ class DialogController(BaseController):
         Args:
             parent_path: The path where the new folder should be created.
         """
-        def on_create_callback(folder_name: str, description: str):
-            """This function is passed to the dialog to be called on success."""
-            self.logger.info(f"Folder creation dialog confirmed for '{folder_name}'")
+        from src.views.components.dialogs.folder_creation_dialog import FolderCreationDialog
+
+        async def create_folder(folder_name: str, description: str):
+            """Creates the folder off the UI thread, then refreshes the browser."""
             # Delegate the actual folder creation to the appropriate service/controller
-            success, message = self.controller.directory_service.create_new_folder(
+            success, message = await asyncio.to_thread(
+                self.controller.directory_service.create_new_folder,
                 parent_path=parent_path,
                 folder_name=folder_name,
                 description=description
             )
             if success:
                 self.controller.project_browser_manager.update_state()
-                self.controller.show_success_message(message)
-                self.controller.update_view()
+                with self.controller.batched_update():
+                    self.controller.show_success_message(message)
+                    self.controller.update_view()
             else:
                 self.controller.show_error_message(message)
 
+        def on_create_callback(folder_name: str, description: str):
+            """This function is passed to the dialog to be called on success."""
+            self.logger.info("Folder creation dialog confirmed for '%s'", folder_name)
+            self.controller.page.run_task(create_folder, folder_name, description)
+
         # Instantiate the refactored dialog with the callback
         dialog = FolderCreationDialog(
             page=self.controller.page,
@@ -82,13 +86,16 @@ class DialogController(BaseController):
         Args:
             parent_path: The directory where the project will be created.
         """
+        from src.views.components.dialogs.project_creation_dialog import ProjectCreationDialog
+
         # The BE number can be derived from the parent path's name
         initial_be = self.controller.directory_service.derive_project_number_from_path(parent_path)
 
         def on_create_callback(form_data: Dict[str, Any]):
             """This function contains the logic to execute on successful creation."""
             self.logger.info("Project dialog confirmed. Passing to ProjectController.")
-            self.controller.project_controller.create_project(
+            self.controller.page.run_task(
+                self.controller.project_controller.create_project,
                 parent_path=parent_path,
                 project_type=form_data["project_type"],
                 form_data=form_data
@@ -109,6 +116,8 @@ class DialogController(BaseController):
         Args:
             e: The triggering event (not used).
         """
+        from src.views.components.dialogs.add_source_to_project_dialog import AddSourceToProjectDialog
+
         dialog = AddSourceToProjectDialog(
             page=self.controller.page, controller=self.controller
         )
@@ -118,6 +127,8 @@ class DialogController(BaseController):
         """
         Opens the refactored source creation dialog.
         """
+        from src.views.components.dialogs.source_creation_dialog import SourceCreationDialog
+
         self.logger.info("Opening new source dialog.")
         
         # --- Define the callback function ---
@@ -155,7 +166,9 @@ class DialogController(BaseController):
         This method fetches the required data (source and link records) and
         defines the callback for what to do when the user saves changes.
         """
-        self.logger.info(f"Opening source editor for source_id: {source_id}")
+        from src.views.components.dialogs.source_editor_dialog import SourceEditorDialog
+
+        self.logger.info("Opening source editor for source_id: %s", source_id)
 
         source = self.controller.source_controller.get_source_record_by_id(source_id)
         link = self.controller.source_controller.get_project_source_link(source_id)
@@ -166,15 +179,17 @@ class DialogController(BaseController):
 
         # --- Define the callback function ---
         def on_save_callback(s_id: str, master_data: Dict[str, Any], link_data: Dict[str, Any]):
-            self.logger.info(f"Editor dialog confirmed for source_id: {s_id}")
+            self.logger.info("Editor dialog confirmed for source_id: %s", s_id)
             # Delegate saving to the SourceController
             try:
-                self.controller.source_controller.submit_master_source_update(s_id, master_data)
-                self.controller.source_controller.submit_project_link_update(s_id, link_data)
-                self.controller.show_success_message("Source updated successfully.")
-                self.controller.update_view() # Refresh the view to show changes
+                # Both updates refresh the view; the batch sends one page update for all of it
+                with self.controller.batched_update():
+                    self.controller.source_controller.submit_master_source_update(s_id, master_data)
+                    self.controller.source_controller.submit_project_link_update(s_id, link_data)
+                    self.controller.show_success_message("Source updated successfully.")
+                    self.controller.update_view() # Refresh the view to show changes
             except Exception as e:
-                self.logger.error(f"Failed to save source updates: {e}")
+                self.logger.error("Failed to save source updates: %s", e)
                 # The controller methods will show their own error messages
                 
         # --- Instantiate and show the dialog ---
@@ -194,7 +209,7 @@ class DialogController(BaseController):
             e: The event/control to remove from the overlay.
         """
         self.controller.page.overlay.remove(e.control)
-        self.controller.page.update()
+        self.controller.update_page()
 
     def show_first_time_setup(self):
         """
@@ -202,6 +217,7 @@ class DialogController(BaseController):
         When setup is complete, saves the display name, marks setup as complete,
         updates the greeting, and navigates to the home page.
         """
+        from src.views.components.dialogs.first_time_setup_dialog import FirstTimeSetupDialog
 
         def on_setup_complete(display_name: str):
             """
@@ -210,8 +226,10 @@ class DialogController(BaseController):
             """
             self.controller.settings_manager.save_display_name(display_name)
             self.controller.user_config_manager.mark_setup_completed()
-            self.controller.main_view.update_greeting()
-            self.controller.navigate_to("home")
+            # The greeting change and the switch to home share one page update
+            with self.controller.batched_update():
+                self.controller.main_view.update_greeting()
+                self.controller.navigate_to("home")
 
         dialog = FirstTimeSetupDialog(self.controller.page, on_setup_complete)
         dialog.show()
@@ -4,13 +4,48 @@ Navigation Controller - Handles navigation-related operations.
 This controller could manage navigation history, breadcrumbs, etc.
 """
 
+import importlib
+import os
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
-
-import flet as ft
+from typing import Dict, FrozenSet, Mapping, Optional
 
 from .base_controller import BaseController
-from config.app_config import PAGES, SPECIAL_PAGES
+from config.app_config import PAGE_TO_VIEWNAME
+
+# The module defining each view class. Views are imported the first time
+# their page is opened, rather than all at once during startup.
+_VIEW_MODULES: Dict[str, str] = {
+    "HomeView": "src.views.pages.home_view",
+    "NewProjectView": "src.views.pages.new_project_view",
+    "ProjectView": "src.views.pages.project_view",
+    "RecentProjectsView": "src.views.pages.recent_projects_view",
+    "ReportsView": "src.views.pages.reports_view",
+    "SettingsView": "src.views.pages.settings_view",
+    "SourcesView": "src.views.pages.sources_view",
+    "HelpView": "src.views.pages.help_view",
+}
+
+# Page name -> view class name for every page whose view we can import.
+# The page config is static, so this is resolved once when the module loads,
+# and it is read-only because build_view_class_map() hands it out directly.
+_VIEW_CLASS_NAMES: Mapping[str, str] = types.MappingProxyType({
+    name: class_name
+    for name, class_name in PAGE_TO_VIEWNAME.items()
+    if class_name in _VIEW_MODULES
+})
+_KNOWN_PAGES: FrozenSet[str] = frozenset(_VIEW_CLASS_NAMES)
+
+# Upper bound on concurrent existence checks when validating recent projects
+RECENT_PROJECT_CHECK_WORKERS = 8
+
+# Seconds a recent project found on disk is trusted before it is checked again
+RECENT_PROJECT_CHECK_TTL = 60.0
+
+# Resolved view classes keyed by page name, shared by every controller instance.
+_VIEW_CLASS_CACHE: Dict[str, type] = {}
 
 
 class NavigationController(BaseController):
@@ -18,46 +53,54 @@ class NavigationController(BaseController):
 
     def __init__(self, app_controller):
         super().__init__(app_controller)
+        # When each recent project path was last found on disk (time.monotonic())
+        self._recent_project_checked: Dict[str, float] = {}
 
-    def build_view_class_map(self) -> Dict[str, type]:
+    @staticmethod
+    def build_view_class_map() -> Mapping[str, str]:
         """
-        Creates a mapping from page names (as used in navigation) to their corresponding view classes.
-        This is used as a factory for instantiating views on demand.
+        Returns the mapping from page names (as used in navigation) to the names of their view classes.
+        The map is precomputed at import; the classes themselves are imported on demand by get_view_class.
         Returns:
-            Dict[str, type]: Mapping from page name to view class.
+            Mapping[str, str]: Read-only mapping from page name to view class name.
         """
-        from views.pages import (
-            HomeView,
-            RecentProjectsView,
-            NewProjectView,
-            ProjectView,
-            SettingsView,
-            SourcesView,
-            ReportsView,
-            HelpView,
-        )
+        return _VIEW_CLASS_NAMES
 
-        all_pages = {p["name"]: p["view_name"] for p in PAGES}
-        all_pages.update(
-            {name: data["view_name"] for name, data in SPECIAL_PAGES.items()}
-        )
+    @staticmethod
+    def known_pages() -> FrozenSet[str]:
+        """
+        Returns the names of every page that has a view.
+        Returns:
+            FrozenSet[str]: The routable page names.
+        """
+        return _KNOWN_PAGES
 
-        view_classes = {
-            "HomeView": HomeView,
-            "NewProjectView": NewProjectView,
-            "ProjectView": ProjectView,
-            "RecentProjectsView": RecentProjectsView,
-            "ReportsView": ReportsView,
-            "SettingsView": SettingsView,
-            "SourcesView": SourcesView,
-            "HelpView": HelpView,
-        }
-        # Return a mapping from page name to the actual view class
-        return {
-            name: view_classes[class_name]
-            for name, class_name in all_pages.items()
-            if class_name in view_classes
-        }
+    def get_view_class(self, page_name: str) -> Optional[type]:
+        """
+        Resolves the view class for a page, importing its module on first use.
+
+        Args:
+            page_name (str): The name of the page.
+
+        Returns:
+            Optional[type]: The view class, or None if the page is unknown.
+        """
+        view_class = _VIEW_CLASS_CACHE.get(page_name)
+        if view_class is not None:
+            return view_class
+
+        class_name = _VIEW_CLASS_NAMES.get(page_name)
+        if not class_name:
+            return None
+        module = importlib.import_module(_VIEW_MODULES[class_name])
+        view_class = getattr(module, class_name)
+        _VIEW_CLASS_CACHE[page_name] = view_class
+        return view_class
+
+    def preload_view_classes(self):
+        """Imports the module of every known view so later first visits skip the import."""
+        for page_name in _VIEW_CLASS_NAMES:
+            self.get_view_class(page_name)
 
     def navigate_to_page(self, page_name: str):
         """
@@ -67,59 +110,92 @@ class NavigationController(BaseController):
         Args:
             page_name (str): The name of the page to navigate to.
         """
-        self.logger.info(f"Navigating to page: {page_name}")
+        self.logger.info("Navigating to page: %s", page_name)
+        # Bound once; every step below goes through the app controller
+        controller = self.controller
         final_page_name = page_name
 
         # Special case: project_view is an alias for either project_dashboard or new_project
         if page_name == "project_view":
-            if self.controller.project_state_manager.has_loaded_project():
+            if controller.project_state_manager.has_loaded_project():
                 final_page_name = "project_dashboard"
             else:
                 final_page_name = "new_project"
 
-        # Validate recent projects list before showing recent_projects page
-        if page_name == "recent_projects":
-            self._validate_recent_projects()
+        # Already showing this page: refresh it in place rather than rebuilding it.
+        # Recent projects still goes through the full path so the list is re-validated.
+        if (
+            final_page_name != "recent_projects"
+            and final_page_name == controller.navigation_manager.get_current_page()
+            and final_page_name in controller.views
+        ):
+            self.logger.debug("Already on '%s'; refreshing in place", final_page_name)
+            controller.update_view(final_page_name)
+            return
 
         # Update the current page in navigation manager
-        self.controller.navigation_manager.set_current_page(final_page_name)
+        controller.navigation_manager.set_current_page(final_page_name)
 
-        # Use the factory to get the correct view class for the page
-        view_class = self.controller.navigation_controller.build_view_class_map().get(
-            final_page_name
-        )
-
-        if view_class:
-            # Instantiate the view and cache it
-            view_instance = self.controller.views.get(final_page_name)
-            if not view_instance:
-                view_instance = view_class(self.controller.page, self.controller)
-                self.controller.views[final_page_name] = view_instance
+        # Reuse the cached view, or import and instantiate its class on first use
+        view_instance = controller.views.get_or_create(final_page_name)
 
+        if view_instance:
             # Build the view content
             content_to_display = view_instance.build()
 
-            # Set the content in the main view and update navigation
-            self.controller.main_view.set_content(content_to_display)
-            self.controller.main_view.update_navigation(final_page_name)
+            # Swap the content and sidebar selection with a single page update
+            controller.main_view.transition_to(content_to_display, final_page_name)
 
-            self.controller.page.update()
+            # Validate the recent projects list in the background once the page is shown
+            if final_page_name == "recent_projects":
+                controller.page.run_thread(self._validate_recent_projects)
 
         else:
-            self.logger.error(f"Could not find view for page: {page_name}. ")
+            self.logger.error("Could not find view for page: %s. ", page_name)
 
     def _validate_recent_projects(self):
         """
         Checks the recent projects list and removes any that no longer exist on disk.
         This keeps the recent projects UI clean and prevents errors from missing files.
+        Runs on a worker thread; the existence checks are spread over a small pool, and
+        the recent projects list is refreshed in place only if something was removed.
+        Paths found within the last RECENT_PROJECT_CHECK_TTL seconds are not checked again.
         """
         self.logger.info("Validating recent projects list...")
-        for project in list(self.controller.user_config_manager.get_recent_projects()):
-            if not Path(project.path).exists():
-                self.logger.warning(
-                    f"Recent project file not found, removing from list: {project.path}"
-                )
-                self.controller.user_config_manager.remove_recent_project(project.path)
+        now = time.monotonic()
+        checked = self._recent_project_checked
+        paths = [
+            p.path
+            for p in self.controller.user_config_manager.get_recent_projects()
+            if now - checked.get(p.path, float("-inf")) >= RECENT_PROJECT_CHECK_TTL
+        ]
+        if not paths:
+            return
+
+        # os.path.exists follows the filesystem's own rules for case and
+        # normalization, so a path that differs only in spelling is not dropped
+        with ThreadPoolExecutor(
+            max_workers=min(RECENT_PROJECT_CHECK_WORKERS, len(paths))
+        ) as executor:
+            missing = [
+                path
+                for path, exists in zip(paths, executor.map(os.path.exists, paths))
+                if not exists
+            ]
+
+        missing_set = set(missing)
+        for path in paths:
+            if path not in missing_set:
+                checked[path] = now
+
+        if not missing:
+            return
+
+        for path in missing:
+            checked.pop(path, None)
+            self.logger.warning("Recent project file not found, removing from list: %s", path)
+        self.controller.user_config_manager.remove_recent_projects(missing)
+        self.controller.update_view("recent_projects")
 
     def remove_recent_project(self, project_path: str):
         """
@@ -128,9 +204,15 @@ class NavigationController(BaseController):
         Args:
             project_path (str): The path of the project to remove.
         """
-        self.logger.info(f"Removing recent project: {project_path}")
+        self.logger.info("Removing recent project: %s", project_path)
         self.controller.user_config_manager.remove_recent_project(project_path)
-        self.controller.page.update()
+        self.controller.update_view("recent_projects")
+
+    def clear_recent_projects(self):
+        """Empties the recent projects list and updates the UI."""
+        self.logger.info("Clearing recent projects")
+        self.controller.user_config_manager.clear_recent_projects()
+        self.controller.update_view("recent_projects")
 
     def submit_new_folder(
         self, parent_path: Path, folder_name: str, description: str = ""
@@ -143,26 +225,8 @@ class NavigationController(BaseController):
             folder_name (str): The name of the new folder.
             description (str, optional): Optional description for the folder.
         """
-        self.logger.info(f"Submitting new folder: {folder_name} at {parent_path}")
+        self.logger.info("Submitting new folder: %s at %s", folder_name, parent_path)
         self.controller.directory_service.create_new_folder(
             parent_path, folder_name, description
         )
-        self.controller.page.update()
-
-    def create_view_for_page(self, page_name: str) -> Optional[ft.Control]:
-        """
-        Factory method to create view instances on demand using the config.
-        Returns a Flet control for the requested page, or a placeholder if not implemented.
-
-        Args:
-            page_name (str): The name of the page to create.
-
-        Returns:
-            Optional[ft.Control]: The view control, or a placeholder if not found.
-        """
-        view_class = self.controller.navigation_controller.build_view_class_map().get(
-            page_name
-        )
-        if view_class:
-            return view_class(self.controller.page, self.controller)
-        return ft.Text(f"View for '{page_name}' not implemented.", color="red")
\ No newline at end of file
+        self.controller.update_page()
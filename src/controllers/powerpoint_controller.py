@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import flet as ft
@@ -14,11 +15,15 @@ class PowerPointController(BaseController):
 
     def __init__(self, controller):
         super().__init__(controller)
-        self.powerpoint_manager = self.controller.powerpoint_manager
         self.logger = logging.getLogger(self.__class__.__name__)
         self.file_picker = ft.FilePicker(on_result=self._on_powerpoint_file_picked)
         self.controller.page.overlay.append(self.file_picker)
 
+    @property
+    def powerpoint_manager(self):
+        """The app's PowerPointManager, which is only created once slides are needed."""
+        return self.controller.powerpoint_manager
+
     def _get_project_or_handle_error(self, operation_name: str) -> Optional[Project]:
         """
         A helper method to get the current project or handle the error if none exists.
@@ -26,7 +31,7 @@ class PowerPointController(BaseController):
         """
         project = self.controller.project_controller.get_current_project()
         if not project:
-            self.logger.error(f"{operation_name} called with no active project.")
+            self.logger.error("%s called with no active project.", operation_name)
             self.controller.show_error_message(
                 "No active project found to perform this operation."
             )
@@ -77,7 +82,7 @@ class PowerPointController(BaseController):
         project.metadata["slide_data"] = fresh_slides
         self.controller.project_service.save_project(project)
 
-        self.logger.info(f"Successfully synced {len(fresh_slides)} slides for project.")
+        self.logger.info("Successfully synced %s slides for project.", len(fresh_slides))
         return fresh_slides
 
     def link_source_to_slide(self, slide_id: str, source_ids: List[str]):
@@ -96,14 +101,18 @@ class PowerPointController(BaseController):
             slide_entry = {"slide_id": slide_id, "title": title, "sources": []}
             slide_data.append(slide_entry)
 
+        # Membership is checked against a set so linking many sources stays linear
+        already_linked = set(slide_entry["sources"])
         for source_id in source_ids:
-            if source_id not in slide_entry["sources"]:
+            if source_id not in already_linked:
                 slide_entry["sources"].append(source_id)
+                already_linked.add(source_id)
 
         project.metadata["slide_data"] = slide_data
         self.controller.project_service.save_project(project)
-        self.controller.show_success_message("Sources linked successfully!")
-        self.controller.update_view()
+        with self.controller.batched_update():
+            self.controller.show_success_message("Sources linked successfully!")
+            self.controller.update_view()
 
     def unlink_source_from_slide(self, slide_id: str, source_ids: List[str]):
         """Removes a list of source UUIDs from a specific slide's source list."""
@@ -117,16 +126,18 @@ class PowerPointController(BaseController):
         )
 
         if slide_entry:
+            ids_to_remove = frozenset(source_ids)
             slide_entry["sources"] = [
                 s_id
                 for s_id in slide_entry.get("sources", [])
-                if s_id not in source_ids
+                if s_id not in ids_to_remove
             ]
 
         project.metadata["slide_data"] = slide_data
         self.controller.project_service.save_project(project)
-        self.controller.show_success_message("Sources unlinked successfully!")
-        self.controller.update_view()
+        with self.controller.batched_update():
+            self.controller.show_success_message("Sources unlinked successfully!")
+            self.controller.update_view()
 
     # --- Source Group Management Methods (Project-Specific) ---
 
@@ -149,7 +160,7 @@ class PowerPointController(BaseController):
             return
 
         self.logger.info(
-            f"Saving source group '{group_name}' to project '{project.project_title}'"
+            "Saving source group '%s' to project '%s'", group_name, project.project_title
         )
         # Get the current groups, update them, and set them back on the project object.
         all_groups = self.get_source_groups()
@@ -158,8 +169,9 @@ class PowerPointController(BaseController):
 
         # Save the entire updated project.
         self.controller.project_service.save_project(project)
-        self.controller.show_success_message(f"Source group '{group_name}' saved.")
-        self.controller.update_view()
+        with self.controller.batched_update():
+            self.controller.show_success_message(f"Source group '{group_name}' saved.")
+            self.controller.update_view()
 
     def delete_source_group(self, group_name: str):
         """Deletes a source group from the current project."""
@@ -168,7 +180,7 @@ class PowerPointController(BaseController):
             return
 
         self.logger.info(
-            f"Deleting source group '{group_name}' from project '{project.project_title}'"
+            "Deleting source group '%s' from project '%s'", group_name, project.project_title
         )
         all_groups = self.get_source_groups()
         if group_name in all_groups:
@@ -177,10 +189,11 @@ class PowerPointController(BaseController):
 
             # Save the entire updated project.
             self.controller.project_service.save_project(project)
-            self.controller.show_success_message(
-                f"Source group '{group_name}' deleted."
-            )
-            self.controller.update_view()
+            with self.controller.batched_update():
+                self.controller.show_success_message(
+                    f"Source group '{group_name}' deleted."
+                )
+                self.controller.update_view()
         else:
             self.controller.show_error_message(
                 f"Source group '{group_name}' not found."
@@ -200,27 +213,31 @@ class PowerPointController(BaseController):
             initial_directory=self.controller.settings_manager.get_default_save_directory(),
         )
 
-    def _on_powerpoint_file_picked(self, e: ft.FilePickerResultEvent):
-        """Callback method that executes after the user selects a file."""
+    async def _on_powerpoint_file_picked(self, e: ft.FilePickerResultEvent):
+        """
+        Callback method that executes after the user selects a file.
+        Saving the project and reading the slides run off the UI thread.
+        """
         if not e.files:
             self.logger.info("File picking cancelled by user.")
             return
 
         selected_file_path = e.files[0].path
-        self.logger.info(f"PowerPoint file selected: {selected_file_path}")
+        self.logger.info("PowerPoint file selected: %s", selected_file_path)
 
         project = self.controller.project_controller.get_current_project()
         if not project:
             return
 
         project.metadata["powerpoint_file"] = selected_file_path
-        self.controller.project_service.save_project(project)
+        await asyncio.to_thread(self.controller.project_service.save_project, project)
 
-        slides = self.get_synced_slide_data()
+        slides = await asyncio.to_thread(self.get_synced_slide_data)
 
-        if slides is not None:
-            self.controller.show_success_message(
-                f"Successfully linked and imported {len(slides)} slides!"
-            )
+        with self.controller.batched_update():
+            if slides is not None:
+                self.controller.show_success_message(
+                    f"Successfully linked and imported {len(slides)} slides!"
+                )
 
-        self.controller.update_view()
+            self.controller.update_view()
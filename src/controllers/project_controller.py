@@ -1,5 +1,10 @@
+import asyncio
+import os
 from pathlib import Path
 from typing import Dict, Any
+
+import flet as ft
+
 from .base_controller import BaseController
 
 
@@ -10,11 +15,12 @@ class ProjectController(BaseController):
     the project state manager (memory).
     """
 
-    def open_project(self, project_path: Path):
+    async def open_project(self, project_path: Path):
         """
         Orchestrates opening a project.
 
-        1. Loads the project file from disk via the DataService.
+        1. Loads the project file from disk via the DataService, off the UI thread,
+           with a progress bar shown over the page while it loads.
         2. Sets the returned Project object as the current app state.
         3. Updates the user's recent projects list.
         4. Navigates to the project dashboard view.
@@ -22,45 +28,63 @@ class ProjectController(BaseController):
         Args:
             project_path (Path): The file path to the project's .json file.
         """
-        self.logger.info(f"Opening project at path: {project_path}")
+        # Convert once; the recent-projects list and messages all want the string form
+        project_path_str = os.fspath(project_path)
+        self.logger.info("Opening project at path: %s", project_path_str)
+        page = self.controller.page
         try:
             # Step 1: Use the DataService to load the project from the file.
-            project_object = self.controller.project_service.load_project(project_path)
+            page.splash = ft.ProgressBar()
+            self.controller.update_page()
+            project_object = await asyncio.to_thread(
+                self.controller.project_service.load_project, project_path
+            )
+            # Removed by the next page update (navigation or error message)
+            page.splash = None
 
             # Step 2: Check if the load was successful before proceeding.
             if project_object:
                 # Step 3: Pass the loaded Project object to the state manager.
                 self.controller.project_state_manager.load_project(project_object)
 
-                # Add it to recent projects
-                self.controller.user_config_manager.add_recent_project(
+                # Add it to recent projects; this rewrites the user config, so it runs off the UI thread too
+                await asyncio.to_thread(
+                    self.controller.user_config_manager.add_recent_project,
                     display_name=project_object.project_title,
-                    path=str(project_path),
+                    path=project_path_str,
                 )
 
                 # Clear the cache for any views that depend on a project
                 self.controller.clear_project_dependent_view_cache()
 
-                # Step 4: Navigate to the project dashboard.
-                self.controller.navigate_to("project_dashboard", force_refresh=True)
+                # Step 4: Navigate to the project dashboard (its view was just evicted above).
+                self.controller.navigate_to("project_dashboard")
+
+                # Warm the pages usually opened next while the dashboard is on screen
+                page.run_task(self.controller.prefetch_project_views, project_object)
             else:
                 self.controller.show_error_message(
-                    f"Failed to load project from path: {project_path}"
+                    f"Failed to load project from path: {project_path_str}"
                 )
 
         except Exception as e:
             self.logger.error(
-                f"An error occurred while opening project: {e}", exc_info=True
+                "An error occurred while opening project: %s", e, exc_info=True
             )
             self.controller.show_error_message(f"An error occurred: {e}")
+        finally:
+            # Navigation can return without updating the page (e.g. a page with no view),
+            # so the progress bar is always taken down here
+            page.splash = None
+            self.controller.update_page()
 
-    def create_project(
+    async def create_project(
         self, parent_path: Path, project_type: str, form_data: Dict[str, Any]
     ):
         """
         Orchestrates creating a new project.
 
-        1. Calls the DataService to create the .json file on disk.
+        1. Calls the DataService to create the .json file on disk, off the UI thread.
         2. If creation is successful, calls the open_project method
            to load the new project into the application state.
 
@@ -69,19 +93,19 @@ class ProjectController(BaseController):
             project_type (str): The project type code (e.g., "STD").
             form_data (Dict[str, Any]): The data collected from the creation dialog.
         """
-        self.logger.info(f"Requesting project creation in: {parent_path}")
+        self.logger.info("Requesting project creation in: %s", parent_path)
         try:
             # The DataService now handles creating the project object and file
-            success, message, new_project = (
-                self.controller.project_service.create_new_project(
-                    parent_dir=parent_path, form_data=form_data
-                )
+            success, message, new_project = await asyncio.to_thread(
+                self.controller.project_service.create_new_project,
+                parent_dir=parent_path,
+                form_data=form_data,
             )
 
             if success and new_project:
                 self.controller.show_success_message("Project created successfully.")
                 # Automatically open the newly created project
-                self.open_project(new_project.file_path)
+                await self.open_project(new_project.file_path)
             else:
                 self.controller.show_error_message(
                     f"Failed to create project: {message}"
@@ -89,7 +113,7 @@ class ProjectController(BaseController):
 
         except Exception as e:
             self.logger.error(
-                f"An error occurred during project creation: {e}", exc_info=True
+                "An error occurred during project creation: %s", e, exc_info=True
             )
             self.controller.show_error_message(f"An error occurred: {e}")
 
@@ -103,16 +127,17 @@ class ProjectController(BaseController):
         # Navigate back to the project browser
         self.controller.navigate_to("new_project", force_refresh=True)
 
-    def update_project_metadata(self, updated_data: Dict[str, Any]):
+    async def update_project_metadata(self, updated_data: Dict[str, Any]):
         """
         Updates the metadata for the currently loaded project.
+        The project file is written off the UI thread.
         """
         project = self.controller.project_state_manager.current_project
         if not project:
             self.controller.show_error_message("No project is loaded.")
             return
 
-        self.logger.info(f"Updating metadata for project: {project.project_title}")
+        self.logger.info("Updating metadata for project: %s", project.project_title)
 
         # Update the project object's attributes from the form data
         for key, value in updated_data.items():
@@ -123,11 +148,11 @@ class ProjectController(BaseController):
 
         # Save the updated project object back to its file
         try:
-            self.controller.project_service.save_project(project)
+            await asyncio.to_thread(self.controller.project_service.save_project, project)
             self.controller.show_success_message("Project metadata saved.")
         except Exception as e:
             self.logger.error(
-                f"Failed to save metadata for project {project.project_title}: {e}",
+                "Failed to save metadata for project %s: %s", project.project_title, e,
                 exc_info=True,
             )
             self.controller.show_error_message("Failed to save metadata.")
@@ -147,12 +172,13 @@ class ProjectController(BaseController):
             project.metadata["on_deck_sources"] = on_deck_sources
             self.controller.project_service.save_project(project)
             self.logger.info(
-                f"Source '{source_id}' added to on deck for project '{project.project_title}'."
+                "Source '%s' added to on deck for project '%s'.", source_id, project.project_title
             )
-            self.controller.show_success_message("Source added to 'On Deck'.")
-            self.controller.update_view()
+            with self.controller.batched_update():
+                self.controller.show_success_message("Source added to 'On Deck'.")
+                self.controller.update_view()
         else:
-            self.logger.warning(f"Source '{source_id}' is already on deck.")
+            self.logger.warning("Source '%s' is already on deck.", source_id)
             self.controller.show_error_message("This source is already on deck.")
 
     def remove_source_from_on_deck(self, source_id: str):
@@ -170,41 +196,44 @@ class ProjectController(BaseController):
             project.metadata["on_deck_sources"] = on_deck_sources
             self.controller.project_service.save_project(project)
             self.logger.info(
-                f"Source '{source_id}' removed from on deck for project '{project.project_title}'."
+                "Source '%s' removed from on deck for project '%s'.", source_id, project.project_title
             )
             self.controller.update_view()
         else:
-            self.logger.warning(f"Source '{source_id}' is not on deck.")
+            self.logger.warning("Source '%s' is not on deck.", source_id)
 
     def remove_source_from_project(self, source_id: str):
         """
         Removes a source link from the project and moves it to the 'on deck' list.
         """
-        self.logger.info(f"Removing source {source_id} from project.")
+        self.logger.info("Removing source %s from project.", source_id)
         project = self.get_current_project()
         if not project:
             self.controller.show_error_message("No project loaded.")
             return
 
         try:
-            # This will remove from project.sources and update the master record
-            self.controller.project_service.remove_source_from_project(
-                project, source_id
-            )
-
-            # Add the source to the 'on deck' list
-            on_deck_sources = project.metadata.get("on_deck_sources", [])
-            if source_id not in on_deck_sources:
-                on_deck_sources.append(source_id)
-                project.metadata["on_deck_sources"] = on_deck_sources
-                self.controller.project_service.save_project(project)
+            # The unlink and the on-deck change are written to the project file once
+            with self.controller.project_service.batched_saves():
+                # This will remove from project.sources and update the master record
+                self.controller.project_service.remove_source_from_project(
+                    project, source_id
+                )
 
-            self.controller.show_success_message("Source moved to On Deck.")
-            # Refresh the current view to reflect the change
-            self.controller.update_view()
+                # Add the source to the 'on deck' list
+                on_deck_sources = project.metadata.get("on_deck_sources", [])
+                if source_id not in on_deck_sources:
+                    on_deck_sources.append(source_id)
+                    project.metadata["on_deck_sources"] = on_deck_sources
+                    self.controller.project_service.save_project(project)
+
+            with self.controller.batched_update():
+                self.controller.show_success_message("Source moved to On Deck.")
+                # Refresh the current view to reflect the change
+                self.controller.update_view()
         except Exception as e:
             self.logger.error(
-                f"Failed to remove source {source_id} from project: {e}", exc_info=True
+                "Failed to remove source %s from project: %s", source_id, e, exc_info=True
             )
             self.controller.show_error_message("Failed to remove source.")
 
@@ -10,6 +10,18 @@ class SettingsController(BaseController):
         """
         self.controller.main_view.refresh_theme()
 
+    def refresh_views_for_theme(self):
+        """
+        Restyles the visible view's existing controls for the current theme.
+        Hidden cached views are left alone: navigating to a page re-runs build(),
+        which reads the new theme then.
+        Callers are expected to follow this with apply_theme(), which updates the page.
+        """
+        current_page = self.controller.navigation_manager.get_current_page()
+        current_view = self.controller.views.get(current_page)
+        if current_view is not None:
+            current_view.refresh_theme()
+
     def get_display_name(self):
         """
         Returns the user's display name, if set.
@@ -20,13 +32,13 @@ class SettingsController(BaseController):
 
     def save_display_name(self, display_name: str):
         """
-        Saves the user's display name.
+        Saves the user's display name and updates the greeting.
+        The settings view already shows the new name in its field, so it is not rebuilt.
         Args:
             display_name (str): The display name to save.
         """
         self.controller.settings_manager.save_display_name(display_name.strip())
         self.controller.main_view.update_greeting()
-        self.controller.navigate_to("settings")
 
     def toggle_theme_mode(self, e=None):
         """
@@ -37,12 +49,10 @@ class SettingsController(BaseController):
 
         # In-memory change
         self.controller.theme_manager.set_theme_mode(new_mode)
-        # Apply the new theme to the UI
+        # Restyle the visible view, then apply the new theme to the UI
+        self.refresh_views_for_theme()
         self.apply_theme()
 
-        # Force a rebuild to change the icon
-        self.controller.navigate_to("settings")
-
     def change_theme_color(self, color_name: str):
         """
         Changes the theme color and updates the UI.
@@ -53,8 +63,6 @@ class SettingsController(BaseController):
         self.controller.settings_manager.save_theme_color(color_name)
         # In-memory change
         self.controller.theme_manager.set_theme_color(color_name)
-        # Apply the new theme to the UI
+        # Restyle the visible view, then apply the new theme to the UI
+        self.refresh_views_for_theme()
         self.apply_theme()
-
-        # Force a rebuild to change the selected color
-        self.controller.navigate_to("settings")
@@ -38,63 +38,77 @@ class SourceController(BaseController):
                 )
                 return
 
-            self.logger.info(f"Master source record '{source_record.id}' created.")
-
-            # Step 2: If the flag is set, add the new source to the current project
-            if add_to_project:
-                project = self.controller.project_controller.get_current_project()
-                if project:
-                    # You might want to get these from the dialog in the future,
-                    # but for now, we can use defaults.
-                    link_data = {
-                        "usage_notes": source_data.get("usage_notes", ""),
-                        "declassify_info": source_data.get("declassify_info", ""),
-                    }
-                    self.add_source_to_project(source_record.id, link_data)
-                else:
-                    self.logger.warning(
-                        "add_to_project was True, but no project is loaded."
-                    )
-
-            self.controller.show_success_message("Source created successfully.")
-            # Refresh the view to show the new source
-            self.controller.update_view()
+            self.logger.info("Master source record '%s' created.", source_record.id)
+
+            with self.controller.batched_update():
+                # Step 2: If the flag is set, add the new source to the current project
+                linked = True
+                if add_to_project:
+                    project = self.controller.project_controller.get_current_project()
+                    if project:
+                        # You might want to get these from the dialog in the future,
+                        # but for now, we can use defaults.
+                        link_data = {
+                            "usage_notes": source_data.get("usage_notes", ""),
+                            "declassify_info": source_data.get("declassify_info", ""),
+                        }
+                        linked = self.add_source_to_project(source_record.id, link_data)
+                    else:
+                        self.logger.warning(
+                            "add_to_project was True, but no project is loaded."
+                        )
+
+                # A failed link has already shown its error; don't report success over it
+                if linked:
+                    self.controller.show_success_message("Source created successfully.")
+                # Refresh the view to show the new source; a refresh already queued
+                # by the link above is merged into this one
+                self.controller.update_view()
 
         except Exception as e:
             self.controller.show_error_message(f"Failed to create source: {e}")
 
-    def add_source_to_project(self, source_id: str, link_data: Dict[str, Any]):
+    def add_source_to_project(self, source_id: str, link_data: Dict[str, Any]) -> bool:
         """
         Creates the link between a source and a project, storing notes
         and declassify info in the project file and updating the master record.
+        Refreshes the current view on success.
+
+        Returns:
+            bool: True if the source was linked.
         """
         project: Project | None = self.controller.project_state_manager.current_project
         if not project:
             self.controller.show_error_message("No active project to add a source to.")
-            return
+            return False
 
         try:
             usage_notes = link_data.get("usage_notes", "")
             declassify_info = link_data.get("declassify_info", "")
-            # Data service handles creating the link and updating the master record
-            self.controller.project_service.add_source_to_project(
-                project, source_id, usage_notes, declassify_info
-            )
-
-            # If the source was on deck, remove it
-            if "on_deck_sources" in project.metadata and source_id in project.metadata["on_deck_sources"]:
-                project.metadata["on_deck_sources"].remove(source_id)
-                self.controller.project_service.save_project(project)
+            # The link and the on-deck change are written to the project file once
+            with self.controller.project_service.batched_saves():
+                # Data service handles creating the link and updating the master record
+                self.controller.project_service.add_source_to_project(
+                    project, source_id, usage_notes, declassify_info
+                )
 
+                # If the source was on deck, remove it
+                on_deck_sources = project.metadata.get("on_deck_sources")
+                if on_deck_sources and source_id in on_deck_sources:
+                    on_deck_sources.remove(source_id)
+                    self.controller.project_service.save_project(project)
 
             self.logger.info(
-                f"Source '{source_id}' successfully linked to project '{project.project_id}'."
+                "Source '%s' successfully linked to project '%s'.", source_id, project.project_id
             )
-            self.controller.show_success_message("Source added to project.")
-            self.controller.update_view()  # Refresh to show the new source in the project list
+            with self.controller.batched_update():
+                self.controller.show_success_message("Source added to project.")
+                self.controller.update_view()  # Refresh to show the new source in the project list
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to add source to project: {e}", exc_info=True)
+            self.logger.error("Failed to add source to project: %s", e, exc_info=True)
             self.controller.show_error_message(f"Failed to add source to project: {e}")
+            return False
 
     def remove_source_from_project(self, source_id: str):
         """
@@ -110,10 +124,11 @@ class SourceController(BaseController):
                 project.id, source_id
             )
             self.logger.info(
-                f"Source '{source_id}' unlinked from project '{project.id}'."
+                "Source '%s' unlinked from project '%s'.", source_id, project.id
             )
-            self.controller.show_success_message("Source removed from project.")
-            self.controller.update_view()
+            with self.controller.batched_update():
+                self.controller.show_success_message("Source removed from project.")
+                self.controller.update_view()
         except Exception as e:
             self.controller.show_error_message(f"Failed to remove source: {e}")
 
@@ -121,7 +136,7 @@ class SourceController(BaseController):
         """
         Submits an update for a source's master record.
         """
-        self.logger.info(f"Updating master record for source ID {source_id}.")
+        self.logger.info("Updating master record for source ID %s.", source_id)
         try:
             self.controller.source_service.update_master_source(source_id, master_data)
         except Exception as e:
@@ -134,19 +149,20 @@ class SourceController(BaseController):
         """
         Submits an update for a project-specific source link.
         """
-        self.logger.info(f"Updating project link for source ID {source_id}.")
+        self.logger.info("Updating project link for source ID %s.", source_id)
         project = self.controller.project_controller.get_current_project()
         if not project:
             self.logger.error("No active project to update source link.")
             return
 
-        self.logger.info(f"Updating project link for source ID {source_id}.")
+        self.logger.info("Updating project link for source ID %s.", source_id)
         try:
             self.controller.project_service.update_project_source_link(
                 project=project, source_id=source_id, link_data=link_data
             )
-            self.controller.show_success_message("Source usage details updated.")
-            self.controller.update_view()
+            with self.controller.batched_update():
+                self.controller.show_success_message("Source usage details updated.")
+                self.controller.update_view()
         except Exception as e:
             self.controller.show_error_message(
                 f"Failed to update source usage details: {e}"
@@ -24,13 +24,23 @@ Classes:
     ProjectBrowserManager: Project browsing controller
 """
 
-from .navigation_manager import NavigationManager
-from .project_state_manager import ProjectStateManager
-from .settings_manager import SettingsManager
-from .theme_manager import ThemeManager
-from .user_config_manager import UserConfigManager
-from .window_manager import WindowManager
-from .project_browser_manager import ProjectBrowserManager
+from utils.lazy_imports import lazy_exports
+
+# Managers are imported lazily (PEP 562) the first time each one is accessed,
+# so importing one manager module does not load the others
+_LAZY_IMPORTS = {
+    "NavigationManager": ".navigation_manager",
+    "ProjectStateManager": ".project_state_manager",
+    "SettingsManager": ".settings_manager",
+    "ThemeManager": ".theme_manager",
+    "UserConfigManager": ".user_config_manager",
+    "WindowManager": ".window_manager",
+    "ProjectBrowserManager": ".project_browser_manager",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "NavigationManager",
@@ -26,7 +26,7 @@ class NavigationManager:
         """
         self.previous_page = self.current_page
         self.current_page = page_name
-        self.logger.info(f"Navigation: {self.previous_page} -> {self.current_page}")
+        self.logger.info("Navigation: %s -> %s", self.previous_page, self.current_page)
     
     def get_current_page(self) -> str:
         """
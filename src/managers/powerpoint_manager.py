@@ -4,10 +4,10 @@ Handles loading and extracting data from PowerPoint presentations.
 """
 
 import logging
+import os
 from pathlib import Path
 from pptx import Presentation
 from typing import List, Tuple, Optional, Dict
-from pprint import pprint
 
 class PowerPointManager:
     """
@@ -18,48 +18,56 @@ class PowerPointManager:
         """Initialize the PowerPoint service."""
         self.controller = controller
         self.logger = logging.getLogger(self.__class__.__name__)
+        # (slide_id, title) pairs per file, keyed by path and reused while the mtime is unchanged
+        self._slide_cache: Dict[str, Tuple[float, List[Tuple[int, str]]]] = {}
 
     def get_slides_from_file(self, filepath: str) -> List[Dict] | None:
         """
         Reads a .pptx file and extracts a list of slides with their IDs and titles.
+        The file is only parsed again once its modification time changes; each call
+        still returns new dictionaries, since callers fill in and store the sources.
 
         Returns:
             A list of dictionaries, e.g.,
             [{'slide_id': 256, 'title': 'Introduction', 'sources': []}, ...]
             or None if the file cannot be read.
         """
-        self.logger.info(f"Reading slides from: {filepath}")
+        self.logger.info("Reading slides from: %s", filepath)
         file_path = Path(filepath)
-        if not file_path.exists():
-            self.logger.warning(f"File not found: {filepath}")
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            self.logger.warning("File not found: %s", filepath)
+            self._slide_cache.pop(filepath, None)
             return None
 
-        try:
-            prs = Presentation(file_path)
-            slides_data = []
-            for i, slide in enumerate(prs.slides):
-                # Use the unique slide_id from python-pptx
-                slide_id = slide.slide_id
-                # Use the new, more robust title extraction logic
-                title = self._extract_slide_title(slide, i)
-
-                slides_data.append(
-                    {
-                        "slide_id": slide_id,
-                        "title": title,
-                        "sources": [],  # This will be populated by the controller
-                    }
+        cached = self._slide_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            slides = cached[1]
+        else:
+            try:
+                prs = Presentation(file_path)
+                slides = [
+                    # Use the unique slide_id from python-pptx and the more robust title extraction
+                    (slide.slide_id, self._extract_slide_title(slide, i))
+                    for i, slide in enumerate(prs.slides)
+                ]
+            except Exception as e:
+                self.logger.error(
+                    "Failed to read presentation file at %s: %s", filepath, e, exc_info=True
                 )
-
-            self.logger.info(f"Successfully extracted {len(slides_data)} slides.")
-            pprint(slides_data)
-            return slides_data
-
-        except Exception as e:
-            self.logger.error(
-                f"Failed to read presentation file at {filepath}: {e}", exc_info=True
-            )
-            return None
+                return None
+            self._slide_cache[filepath] = (mtime, slides)
+            self.logger.info("Successfully extracted %s slides.", len(slides))
+
+        return [
+            {
+                "slide_id": slide_id,
+                "title": title,
+                "sources": [],  # This will be populated by the controller
+            }
+            for slide_id, title in slides
+        ]
 
     def _extract_slide_title(self, slide, slide_index: int) -> str:
         """
@@ -4,10 +4,15 @@ Project Browser Manager
 Manages the state and business logic for the project browsing interface.
 """
 
+import os
 import re
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+# Folder-name patterns checked on every render of the browser's action button
+_YEAR_FOLDER_RE = re.compile(r"^\d{4}([A-Z]{2})?\Z")
+_PROJECT_FOLDER_RE = re.compile(r"^\d{4}[A-Z]{2}\d{4}\b|^\d{10}\b")
+
 
 class ProjectBrowserManager:
     """Manages the state for browsing the project directory structure."""
@@ -43,7 +48,7 @@ class ProjectBrowserManager:
         folder_name = self.current_path.name
         return (
             # TODO THIS IS WHERE WE PUT THE RIGHT REGEX IN
-            bool(re.match(r"^\d{4}([A-Z]{2})?$", folder_name))
+            bool(_YEAR_FOLDER_RE.match(folder_name))
         )
 
     @property
@@ -53,7 +58,7 @@ class ProjectBrowserManager:
             return False
 
         folder_name = self.current_path.name
-        return bool(re.match(r"^\d{4}[A-Z]{2}\d{4}\b|^\d{10}\b", folder_name))
+        return bool(_PROJECT_FOLDER_RE.match(folder_name))
 
     # --- Public Properties for View Display ---
     @property
@@ -146,7 +151,7 @@ class ProjectBrowserManager:
         countries = []
         for primary_folder in self.primary_folders:
             primary_path = self.root_path / primary_folder
-            if primary_path.exists() and primary_path.is_dir():
+            if primary_path.is_dir():
                 # Get all subdirectories (countries) in this primary folder
                 country_items = self.controller.directory_service.get_folder_contents(str(primary_path))
                 for item in country_items:
@@ -185,8 +190,6 @@ class ProjectBrowserManager:
         Performs progressive search within the current country folder.
         Searches recursively for folders that start with the search term.
         """
-        import os
-        
         matching_folders = []
         search_term = search_term.lower()
         
@@ -7,7 +7,7 @@ of the ProjectService.
 """
 from typing import Optional, Dict, Any, List
 import logging
-from models import Project, SourceRecord
+from src.models import Project, SourceRecord
 
 class ProjectStateManager:
     """Manages the in-memory state of the currently active project."""
@@ -25,14 +25,14 @@ class ProjectStateManager:
         Args:
             project_model: A Project model object, typically loaded by the ProjectService.
         """
-        self.logger.info(f"Loading project into state: {project_model.project_title}")
+        self.logger.info("Loading project into state: %s", project_model.project_title)
         self.current_project = project_model
-        self.logger.info(f"Project '{project_model.project_title}' loaded into state.")
+        self.logger.info("Project '%s' loaded into state.", project_model.project_title)
 
     def unload_project(self):
         """Clears the currently loaded project from the state."""
         if self.current_project:
-            self.logger.info(f"Unloading project from state: {self.current_project.project_title}")
+            self.logger.info("Unloading project from state: %s", self.current_project.project_title)
         else:
             self.logger.info("No project to unload from state")
         self.current_project = None
@@ -1,23 +1,19 @@
-from typing import Optional, List
+from typing import Optional, List, TYPE_CHECKING
 import getpass
 import logging
 
 # Configuration imports
-from config.app_config import (
-    USER_DATA_DIR,
-    DEFAULT_WINDOW_WIDTH,
-    DEFAULT_WINDOW_HEIGHT,
-    DEFAULT_THEME,
-    DEFAULT_SAVE_DIR,
-)
+from config.app_config import DEFAULT_SAVE_DIR
 
 from src.models.user_config_models import (
     UserConfig,
     WindowConfig,
-    ThemeConfig,
     RecentProject,
 )
 
+if TYPE_CHECKING:
+    from src.managers.user_config_manager import UserConfigManager
+
 
 class SettingsManager:
     """
@@ -25,60 +21,31 @@ class SettingsManager:
 
     This class acts as a bridge between the UI and the underlying configuration/theme managers.
     It exposes methods for changing user preferences and notifies the controller via callbacks.
+    The user's config file is owned by UserConfigManager; this class reads and saves
+    the same in-memory config through it, so neither can overwrite the other's changes.
     """
 
-    def __init__(self):
+    def __init__(self, user_config_manager: "UserConfigManager"):
         """
         Initializes the SettingsManager.
 
         Args:
-            user_config (UserConfigManager): The user configuration manager instance.
-            theme_manager (ThemeManager): The theme manager instance.
+            user_config_manager (UserConfigManager): The user configuration manager instance.
         """
         self.logger = logging.getLogger(__name__)
         self.username = getpass.getuser()
-        self.user_config_dir = USER_DATA_DIR
-        self.user_config_file = self.user_config_dir / f"{self.username}.json"
-
-        # Define the default configuration using our dataclasses
-        self.default_config = UserConfig(
-            window=WindowConfig(
-                width=DEFAULT_WINDOW_WIDTH,
-                height=DEFAULT_WINDOW_HEIGHT,
-                maximized=False,
-            ),
-            theme=ThemeConfig(mode=DEFAULT_THEME, color="blue"),
-        )
+        self.user_config_manager = user_config_manager
 
-        # Load or create config
-        self.user_config = self._load_config()
-
-    def _load_config(self) -> UserConfig:
-        """
-        Loads the user configuration from disk, or returns the default config if not found or invalid.
-        Returns:
-            UserConfig: The loaded or default user configuration.
-        """
-        self.user_config_dir.mkdir(parents=True, exist_ok=True)
-        config = UserConfig.load_from_json(self.user_config_file)
-        if config:
-            self.logger.info(f"Loaded config for user: {self.username}")
-            return config
-        self.logger.warning(
-            f"No config for '{self.username}' found or it was corrupt. Creating new default config."
-        )
-        return self.default_config
+    @property
+    def user_config(self) -> UserConfig:
+        """The user configuration shared with UserConfigManager."""
+        return self.user_config_manager.config
 
     def save_config(self):
         """
-        Saves the current configuration to its JSON file on disk.
-        Logs success or error.
+        Saves the current configuration to its JSON file on disk through UserConfigManager.
         """
-        try:
-            self.user_config.save_to_json(self.user_config_file)
-            self.logger.info(f"Config saved for user: {self.username}")
-        except Exception as e:
-            self.logger.error(f"Error saving config: {e}", exc_info=True)
+        self.user_config_manager.save_config()
 
     def save_window_config(
         self,
@@ -215,24 +182,13 @@ class SettingsManager:
             display_name (str): The display name of the project.
             path (str): The filesystem path to the project.
         """
-        # Remove if already exists to move it to the top
-        self.user_config.recent_projects = [
-            p for p in self.user_config.recent_projects if p.path != path
-        ]
-        # Add to the beginning of the list
-        self.user_config.recent_projects.insert(
-            0, RecentProject(display_name=display_name, path=path)
-        )
-        # Keep only the 10 most recent
-        self.user_config.recent_projects = self.user_config.recent_projects[:10]
-        self.save_config()
+        self.user_config_manager.add_recent_project(display_name, path)
 
     def clear_recent_projects(self):
         """
         Clears the list of recent projects and saves the config.
         """
-        self.user_config.recent_projects.clear()
-        self.save_config()
+        self.user_config_manager.clear_recent_projects()
 
     def remove_recent_project(self, path_to_remove: str):
         """
@@ -240,10 +196,7 @@ class SettingsManager:
         Args:
             path_to_remove (str): The path of the project to remove.
         """
-        self.user_config.recent_projects = [
-            p for p in self.user_config.recent_projects if p.path != path_to_remove
-        ]
-        self.save_config()
+        self.user_config_manager.remove_recent_project(path_to_remove)
 
     def get_default_save_directory(self) -> str:
         """
@@ -8,7 +8,8 @@ Handles window state, theme, display name, setup status, and recent projects.
 
 import getpass
 import logging
-from typing import Optional, List
+import threading
+from typing import Iterable, Optional, List
 
 # Configuration imports
 from config.app_config import (
@@ -39,7 +40,7 @@ class UserConfigManager:
     def __init__(self):
         """
         Initializes the UserConfigManager for the current user.
-        Loads the user's config from disk, or creates a default config if none exists.
+        Starts from the default config; call load() to read the user's config from disk.
         """
         self.logger = logging.getLogger(__name__)
         self.username = getpass.getuser()
@@ -56,7 +57,15 @@ class UserConfigManager:
             theme=ThemeConfig(mode=DEFAULT_THEME, color="blue"),
         )
 
-        # Load or create config
+        # Replaced by the on-disk config once load() runs
+        self.config = self.default_config
+
+        # Recent projects are updated from worker threads as well as the UI;
+        # held around each change and the save that follows it
+        self._lock = threading.RLock()
+
+    def load(self):
+        """Loads the user's config from disk, or keeps the default config if none exists."""
         self.config = self._load_config()
 
     def _load_config(self) -> UserConfig:
@@ -68,10 +77,10 @@ class UserConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         config = UserConfig.load_from_json(self.config_file)
         if config:
-            self.logger.info(f"Loaded config for user: {self.username}")
+            self.logger.info("Loaded config for user: %s", self.username)
             return config
         self.logger.warning(
-            f"No config for '{self.username}' found or it was corrupt. Creating new default config."
+            "No config for '%s' found or it was corrupt. Creating new default config.", self.username
         )
         return self.default_config
 
@@ -81,10 +90,11 @@ class UserConfigManager:
         Logs success or error.
         """
         try:
-            self.config.save_to_json(self.config_file)
-            self.logger.info(f"Config saved for user: {self.username}")
+            with self._lock:
+                self.config.save_to_json(self.config_file)
+            self.logger.info("Config saved for user: %s", self.username)
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}", exc_info=True)
+            self.logger.error("Error saving config: %s", e, exc_info=True)
 
     # --- Accessor & Mutator Methods ---
 
@@ -220,24 +230,25 @@ class UserConfigManager:
             display_name (str): The display name of the project.
             path (str): The filesystem path to the project.
         """
-        # Remove if already exists to move it to the top
-        self.config.recent_projects = [
-            p for p in self.config.recent_projects if p.path != path
-        ]
-        # Add to the beginning of the list
-        self.config.recent_projects.insert(
-            0, RecentProject(display_name=display_name, path=path)
-        )
-        # Keep only the 10 most recent
-        self.config.recent_projects = self.config.recent_projects[:10]
-        self.save_config()
+        # Put it first, drop any older entry for the same path, and keep only
+        # the 10 most recent, building the new list in a single pass
+        with self._lock:
+            recent_projects = [RecentProject(display_name=display_name, path=path)]
+            for p in self.config.recent_projects:
+                if len(recent_projects) == 10:
+                    break
+                if p.path != path:
+                    recent_projects.append(p)
+            self.config.recent_projects = recent_projects
+            self.save_config()
 
     def clear_recent_projects(self):
         """
         Clears the list of recent projects and saves the config.
         """
-        self.config.recent_projects.clear()
-        self.save_config()
+        with self._lock:
+            self.config.recent_projects.clear()
+            self.save_config()
 
     def remove_recent_project(self, path_to_remove: str):
         """
@@ -245,7 +256,19 @@ class UserConfigManager:
         Args:
             path_to_remove (str): The path of the project to remove.
         """
-        self.config.recent_projects = [
-            p for p in self.config.recent_projects if p.path != path_to_remove
-        ]
-        self.save_config()
+        self.remove_recent_projects([path_to_remove])
+
+    def remove_recent_projects(self, paths_to_remove: Iterable[str]):
+        """
+        Removes several projects from the recent projects list and saves the config once.
+        The config is not rewritten if none of the paths were in the list.
+        Args:
+            paths_to_remove (Iterable[str]): The paths of the projects to remove.
+        """
+        paths_to_remove = set(paths_to_remove)
+        with self._lock:
+            kept = [p for p in self.config.recent_projects if p.path not in paths_to_remove]
+            if len(kept) == len(self.config.recent_projects):
+                return
+            self.config.recent_projects = kept
+            self.save_config()
@@ -213,8 +213,10 @@ class Project:
     def save(self):
         """Saves the project data to its file_path."""
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Encode the whole document up front and write it in one call
+        payload = json.dumps(self.to_dict(), indent=4)
         with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=4)
+            f.write(payload)
 
     @classmethod
     def load(cls, file_path: Path) -> Optional[Project]:
@@ -231,7 +233,7 @@ class Project:
 
     def add_source(self, source_id: str, notes: str = "", declassify: str = ""):
         """Adds a source to the project. Sources are ordered by their position in the list."""
-        if source_id not in [s.source_id for s in self.sources]:
+        if not any(s.source_id == source_id for s in self.sources):
             link = ProjectSourceLink(source_id=source_id, notes=notes, declassify=declassify)
             self.sources.append(link)
 
@@ -1,10 +1,20 @@
 """Services package for business logic components"""
 
-# from .admin_auth_service import AdminAuthService
-from .data_service import DataService
-from .directory_service import DirectoryService
-from .project_service import ProjectService
-from .source_service import SourceService
+from utils.lazy_imports import lazy_exports
+
+# Services are imported lazily (PEP 562) the first time each one is accessed,
+# so importing one service module does not load the others
+_LAZY_IMPORTS = {
+    # "AdminAuthService": ".admin_auth_service",
+    "DataService": ".data_service",
+    "DirectoryService": ".directory_service",
+    "ProjectService": ".project_service",
+    "SourceService": ".source_service",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "DataService",
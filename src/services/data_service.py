@@ -181,7 +181,7 @@ class DataService:
                         self.update_master_source(source_id, source_record.to_dict())
 
             except Exception as e:
-                self.logger.error(f"Failed to add source {source_id} to project {project.project_title}: {e}", exc_info=True)
+                self.logger.error("Failed to add source %s to project %s: %s", source_id, project.project_title, e, exc_info=True)
 
     def remove_source_from_project(self, project: Project, source_id: str):
         project.remove_source(source_id)
@@ -194,12 +194,12 @@ class DataService:
         project.sources = new_source_links
         project.save()
 
-        self.logger.info(f"Saving project: {project.project_title} to {project.file_path}")
+        self.logger.info("Saving project: %s to %s", project.project_title, project.file_path)
         try:
             project.save()
-            self.logger.info(f"Successfully saved project: {project.project_title}")
+            self.logger.info("Successfully saved project: %s", project.project_title)
         except Exception as e:
-            self.logger.error(f"Error saving project {project.project_title}: {e}", exc_info=True)
+            self.logger.error("Error saving project %s: %s", project.project_title, e, exc_info=True)
             raise
 
    
@@ -4,6 +4,7 @@ Directory Service
 Handles generic file and directory operations for the application.
 """
 
+import os
 import re
 import logging
 from pathlib import Path
@@ -11,6 +12,11 @@ from typing import List, Dict, Any, Tuple, Optional
 
 from config import PROJECT_DATA_DIR, get_country_from_project_path
 
+# A standalone 10-digit BE number anywhere in a path
+_BE_NUMBER_RE = re.compile(r"\b\d{10}\b")
+# Characters that are not allowed in Windows file and folder names
+_INVALID_NAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
 class DirectoryService:
     """Manages file and directory interactions."""
 
@@ -24,24 +30,26 @@ class DirectoryService:
         """Gets the list of primary region folders (e.g., 'ROW', 'CONUS')."""
         if not self.project_data_dir.exists():
             return []
-        return sorted([p.name for p in self.project_data_dir.iterdir() if p.is_dir()])
+        with os.scandir(self.project_data_dir) as it:
+            return sorted([entry.name for entry in it if entry.is_dir()])
 
     def get_folder_contents(self, folder_path: str) -> List[Dict[str, Any]]:
         """Gets the contents of a given folder path."""
-        path = Path(folder_path)
-        if not path.is_dir():
+        if not os.path.isdir(folder_path):
             return []
-        contents = [
-            {"name": p.name, "path": str(p), "is_directory": p.is_dir()}
-            for p in path.iterdir()
-        ]
+        # scandir reuses the file type from the directory listing, avoiding a stat per entry
+        with os.scandir(folder_path) as it:
+            contents = [
+                {"name": entry.name, "path": entry.path, "is_directory": entry.is_dir()}
+                for entry in it
+            ]
         # Sort by type (directories first), then by name
         return sorted(contents, key=lambda x: (not x["is_directory"], x["name"].lower()))
 
     def create_new_folder(self, parent_path: Path, folder_name: str, description: Optional[str] = None) -> Tuple[bool, str]:
         """Creates a new folder with an optional description."""
-        sanitized_filename = re.sub(r'[<>:"/\\|?*]', "", folder_name).strip()
-        sanitized_description = (re.sub(r'[<>:"/\\|?*]', "", description).strip() if description else None)
+        sanitized_filename = _INVALID_NAME_CHARS_RE.sub("", folder_name).strip()
+        sanitized_description = (_INVALID_NAME_CHARS_RE.sub("", description).strip() if description else None)
 
         if not sanitized_filename:
             return False, f"Invalid folder name '{folder_name}'."
@@ -52,10 +60,10 @@ class DirectoryService:
             return False, f"A folder or file named '{new_folder_path.name}' already exists."
         try:
             new_folder_path.mkdir(parents=True, exist_ok=False)
-            self.logger.info(f"Successfully created folder: {new_folder_path}")
+            self.logger.info("Successfully created folder: %s", new_folder_path)
             return True, f"Successfully created folder '{new_folder_path.name}'."
         except OSError as e:
-            self.logger.error(f"Failed to create directory {new_folder_path}: {e}")
+            self.logger.error("Failed to create directory %s: %s", new_folder_path, e)
             return False, f"Failed to create directory: {e}"
         
     def get_country_folders(self) -> List[str]:
@@ -65,9 +73,10 @@ class DirectoryService:
         for region in primary_folders:
             region_path = self.project_data_dir / region
             if region_path.is_dir():
-                for country_path in region_path.iterdir():
-                    if country_path.is_dir() and not country_path.name.startswith('.') and not country_path.name == 'Non CR Products':
-                        countries.append(country_path.name)
+                with os.scandir(region_path) as it:
+                    for entry in it:
+                        if entry.is_dir() and not entry.name.startswith('.') and not entry.name == 'Non CR Products':
+                            countries.append(entry.name)
         # Use set to ensure uniqueness and then sort alphabetically
         return sorted(list(set(countries)))
     
@@ -77,5 +86,5 @@ class DirectoryService:
     
     def derive_project_number_from_path(self, parent_path: Path) -> str:
         """Gets the BE number from the string representation of the path."""
-        match = re.search(r"\b\d{10}\b", str(parent_path))
+        match = _BE_NUMBER_RE.search(str(parent_path))
         return match.group(0) if match else ""
\ No newline at end of file
@@ -6,6 +6,7 @@ Migration Service for converting old format project files to new format.
 import json
 import uuid
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List
 import logging
@@ -13,6 +14,9 @@ import logging
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent file migrations in migrate_directory
+MAX_MIGRATION_WORKERS = 8
+
 
 class MigrationService:
     """Service for migrating project data from old format to new format."""
@@ -224,25 +228,45 @@ class MigrationService:
         
         self.logger.info(f"Found {len(json_files)} JSON files to migrate")
         
-        for json_file in json_files:
-            try:
-                # Create backup if requested
-                if backup:
-                    backup_path = json_file.parent / f"{json_file.stem}_backup.json"
-                    json_file.rename(backup_path)
-                    source_file = backup_path
-                else:
-                    source_file = json_file
-                
-                # Migrate file
-                success = self.migrate_file(str(source_file), str(json_file))
+        # Each file is independent and the work is dominated by file I/O,
+        # so migrate them concurrently
+        max_workers = min(MAX_MIGRATION_WORKERS, len(json_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(
+                lambda json_file: self._migrate_directory_entry(json_file, backup),
+                json_files,
+            )
+            for json_file, success in zip(json_files, outcomes):
                 results[json_file.name] = success
-                
-            except Exception as e:
-                self.logger.error(f"Error processing {json_file}: {e}")
-                results[json_file.name] = False
         
         return results
+    
+    def _migrate_directory_entry(self, json_file: Path, backup: bool) -> bool:
+        """
+        Backs up (optionally) and migrates a single file for migrate_directory.
+        
+        Args:
+            json_file: Path to the old format file
+            backup: Whether to create a backup copy of the original file
+            
+        Returns:
+            bool: True if migration successful, False otherwise
+        """
+        try:
+            # Create backup if requested
+            if backup:
+                backup_path = json_file.parent / f"{json_file.stem}_backup.json"
+                json_file.rename(backup_path)
+                source_file = backup_path
+            else:
+                source_file = json_file
+            
+            # Migrate file
+            return self.migrate_file(str(source_file), str(json_file))
+            
+        except Exception as e:
+            self.logger.error(f"Error processing {json_file}: {e}")
+            return False
 
 
 def main():
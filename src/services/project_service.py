@@ -8,6 +8,8 @@ saving, and modification.
 import re
 import uuid
 import logging
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -16,6 +18,18 @@ from config import get_project_type_config, get_country_from_project_path
 from src.models import Project, ProjectType, ProjectSourceLink, SourceRecord
 from .source_service import SourceService
 
+# A run of four or more digits in a folder name, taken as its BE number
+_BE_NUMBER_RE = re.compile(r"(\d{4,})")
+
+
+class _SaveBatch(threading.local):
+    """batched_saves() state for one thread, so saves from other threads are never deferred into it."""
+
+    def __init__(self):
+        self.depth = 0
+        # Projects saved inside the batch, written once when it exits
+        self.pending: Dict[int, Project] = {}
+
 
 class ProjectService:
     """Handles loading, saving, and modifying project data."""
@@ -23,35 +37,75 @@ class ProjectService:
     def __init__(self, source_service: SourceService):
         self.logger = logging.getLogger(__name__)
         self.source_service = source_service
+        self._save_batch = _SaveBatch()
+        # One lock per project file, so two threads never write the same file at once
+        self._write_locks: Dict[Path, threading.Lock] = {}
+        self._write_locks_guard = threading.Lock()
         self.logger.info("ProjectService initialized")
 
     def load_project(self, file_path: Path) -> Optional[Project]:
         """Loads a project from a JSON file."""
-        self.logger.info(f"Loading project from: {file_path}")
+        self.logger.info("Loading project from: %s", file_path)
         try:
             project = Project.load(file_path)
             if project:
                 self.logger.info(
-                    f"Successfully loaded project: {project.project_title}"
+                    "Successfully loaded project: %s", project.project_title
                 )
             return project
         except Exception as e:
             self.logger.error(
-                f"Error loading project from {file_path}: {e}", exc_info=True
+                "Error loading project from %s: %s", file_path, e, exc_info=True
             )
             return None
 
+    @contextmanager
+    def batched_saves(self):
+        """
+        Groups project saves made by one operation into a single write per project.
+        save_project() calls inside the block are deferred, and each project is
+        written once when the outermost block exits. Write errors are raised from there.
+        The batch belongs to the calling thread.
+        """
+        batch = self._save_batch
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0 and batch.pending:
+                pending, batch.pending = batch.pending, {}
+                for project in pending.values():
+                    self._write_project(project)
+
     def save_project(self, project: Project):
-        """Saves a project to its file path."""
+        """Saves a project to its file path, or at the end of this thread's enclosing batched_saves() block."""
+        batch = self._save_batch
+        if batch.depth:
+            batch.pending[id(project)] = project
+            return
+        self._write_project(project)
+
+    def _write_lock(self, file_path: Path) -> threading.Lock:
+        """Returns the lock that serializes writes to one project file."""
+        with self._write_locks_guard:
+            lock = self._write_locks.get(file_path)
+            if lock is None:
+                lock = self._write_locks[file_path] = threading.Lock()
+            return lock
+
+    def _write_project(self, project: Project):
+        """Writes a project to its file path."""
         self.logger.info(
-            f"Saving project: {project.project_title} to {project.file_path}"
+            "Saving project: %s to %s", project.project_title, project.file_path
         )
         try:
-            project.save()
-            self.logger.info(f"Successfully saved project: {project.project_title}")
+            with self._write_lock(project.file_path):
+                project.save()
+            self.logger.info("Successfully saved project: %s", project.project_title)
         except Exception as e:
             self.logger.error(
-                f"Error saving project {project.project_title}: {e}", exc_info=True
+                "Error saving project %s: %s", project.project_title, e, exc_info=True
             )
             raise
 
@@ -116,8 +170,6 @@ class ProjectService:
 
         self.save_project(project)
 
-        self.save_project(project)
-
     def remove_source_from_project(self, project: Project, source_id: str):
         """Removes a source link from a project and updates the master source record."""
         project.remove_source(source_id)
@@ -154,7 +206,7 @@ class ProjectService:
             # Look for numeric patterns that could be BE numbers
             # Common pattern: YYYY followed by digits (e.g., 2024333333)
             # TODO update this in production
-            number_match = re.search(r"(\d{4,})", dir_name)
+            number_match = _BE_NUMBER_RE.search(dir_name)
 
             if number_match:
                 return number_match.group(1)
@@ -162,9 +214,10 @@ class ProjectService:
             # TODO is the following logic still needed?
             # If no number found in current directory, try parent directories
             # but only go up one level to avoid false positives
-            if parent_path.parent and parent_path.parent != parent_path:
-                parent_dir_name = parent_path.parent.name
-                parent_number_match = re.search(r"(\d{4,})", parent_dir_name)
+            grandparent_path = parent_path.parent
+            if grandparent_path and grandparent_path != parent_path:
+                parent_dir_name = grandparent_path.name
+                parent_number_match = _BE_NUMBER_RE.search(parent_dir_name)
                 if parent_number_match:
                     return parent_number_match.group(1)
 
@@ -222,7 +275,7 @@ class ProjectService:
             return True, "Project source link and master record updated successfully."
         except Exception as e:
             self.logger.error(
-                f"Failed to save project or update master source: {e}", exc_info=True
+                "Failed to save project or update master source: %s", e, exc_info=True
             )
             return False, "Failed to save project or update master source."
 
@@ -237,4 +290,4 @@ class ProjectService:
             project.associate_powerpoint_file(powerpoint_file)
             self.save_project(project)
         except Exception as e:
-            self.logger.error(f"Failed to associate PowerPoint file: {e}", exc_info=True)
+            self.logger.error("Failed to associate PowerPoint file: %s", e, exc_info=True)
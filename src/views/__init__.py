@@ -1,10 +1,27 @@
+"""
+Views package.
+
+Page views are resolved lazily (PEP 562) so that importing MainView or
+BaseView does not import every page in the application.
+"""
+
+from utils.lazy_imports import lazy_exports
+
 from .main_view import MainView
 from .base_view import BaseView
-from .pages.home_view import HomeView
-from .pages.recent_projects_view import RecentProjectsView
-from .pages.new_project_view import NewProjectView
-from .pages.project_view import ProjectView
-from .pages.help_view import HelpView
+
+# Maps each lazily exported page class to the submodule that defines it
+_LAZY_IMPORTS = {
+    "HomeView": ".pages.home_view",
+    "RecentProjectsView": ".pages.recent_projects_view",
+    "NewProjectView": ".pages.new_project_view",
+    "ProjectView": ".pages.project_view",
+    "HelpView": ".pages.help_view",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "MainView",
@@ -4,11 +4,13 @@ Base View (Simplified)
 A simple base class for all page views in the application. It provides
 common helper methods and a safe 'colors' property for consistent theming.
 """
+from abc import ABC, abstractmethod
+
 import flet as ft
 
-class BaseView:
+class BaseView(ABC):
     """Base class for all views in the application."""
-    
+
     def __init__(self, page: ft.Page, controller):
         self.page = page
         self.controller = controller
@@ -27,12 +29,19 @@ class BaseView:
         # ColorScheme object, removing all complex logic from the view.
         return self.controller.theme_manager.get_default_color_scheme()
 
+    @abstractmethod
     def build(self) -> ft.Control:
         """
         Builds and returns the view's root Flet control.
         This method must be implemented by all subclasses.
         """
-        raise NotImplementedError("Each view must implement the build method.")
+
+    def refresh_theme(self):
+        """
+        Updates the view's existing controls after a theme change.
+        Most views only use theme color tokens and need no work here, so the default is a no-op.
+        """
+        pass
 
     def show_error(self, message: str, details: str = "") -> ft.Control:
         """Returns a standardized error message control using the safe colors property."""
@@ -85,6 +94,6 @@ class BaseView:
         )
 
     def update_view(self):
-        """Refreshes the view by calling page.update(). Subclasses can override for specific logic."""
+        """Refreshes the view by requesting a page update. Subclasses can override for specific logic."""
         if self.page:
-            self.page.update()
+            self.controller.update_page()
@@ -1,12 +1,22 @@
-from .breadcrumb import Breadcrumb
-from .sidebar import Sidebar
-from .app_bar import AppBar
-from .cards.project_source_card import ProjectSourceCard
-from .cards.recent_project_card import RecentProjectCard
-from .cards.on_deck_card import OnDeckCard
-from .dialogs.source_citation_dialog import SourceCitationDialog
-from .slide_carousel import SlideCarousel
-from .app_fab import AppFAB
+from utils.lazy_imports import lazy_exports
+
+# Components are imported lazily (PEP 562) the first time each one is accessed,
+# so importing the app bar at startup does not load every card and dialog
+_LAZY_IMPORTS = {
+    "Breadcrumb": ".breadcrumb",
+    "Sidebar": ".sidebar",
+    "AppBar": ".app_bar",
+    "ProjectSourceCard": ".cards.project_source_card",
+    "RecentProjectCard": ".cards.recent_project_card",
+    "OnDeckCard": ".cards.on_deck_card",
+    "SourceCitationDialog": ".dialogs.source_citation_dialog",
+    "SlideCarousel": ".slide_carousel",
+    "AppFAB": ".app_fab",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "Breadcrumb",
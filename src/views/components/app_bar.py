@@ -48,8 +48,8 @@ class AppBar(ft.AppBar):
         )
 
     def update_greeting(self, new_greeting: str):
-        """Updates the greeting text displayed in the AppBar."""
+        """
+        Sets the greeting text displayed in the AppBar.
+        The caller updates the page, so the change can share an update with others.
+        """
         self.greeting_text.value = new_greeting
-        # The .page attribute is automatically available when the control is added to a page.
-        if self.page:
-            self.page.update()
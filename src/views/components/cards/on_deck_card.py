@@ -1,7 +1,7 @@
 import flet as ft
 from .base_card import BaseCard
-from models.source_models import SourceRecord
-from views.components.dialogs.source_citation_dialog import SourceCitationDialog
+from src.models.source_models import SourceRecord
+from src.views.components.dialogs.source_citation_dialog import SourceCitationDialog
 
 
 class OnDeckCard(BaseCard):
@@ -101,8 +101,7 @@ class OnDeckCard(BaseCard):
 
     def _handle_remove_click(self, e):
         """Calls the controller to remove the source from the On Deck list."""
-        if hasattr(self.controller.project_controller, "remove_source_from_on_deck"):
-            self.controller.project_controller.remove_source_from_on_deck(self.source.id)
+        self.controller.project_controller.remove_source_from_on_deck(self.source.id)
 
     def _show_citation_dialog(self, e):
         """Shows the source citation dialog."""
@@ -1,7 +1,7 @@
 import flet as ft
 from .base_card import BaseCard
-from models.source_models import SourceRecord
-from models.project_models import ProjectSourceLink
+from src.models.source_models import SourceRecord
+from src.models.project_models import ProjectSourceLink
 
 
 class ProjectSourceCard(BaseCard):
@@ -87,15 +87,12 @@ class ProjectSourceCard(BaseCard):
 
     def _handle_view_edit_source(self, e):
         """Handles the view/edit source action."""
-        if hasattr(self.controller.dialog_controller, "open_source_editor_dialog"):
-            self.controller.dialog_controller.open_source_editor_dialog(self.source.id)
+        self.controller.dialog_controller.open_source_editor_dialog(self.source.id)
         if e.control.page:
             e.control.page.update()
 
     def _handle_remove_from_project(self, e):
         """Handles removing the source from the project via the controller."""
-        self.logger.info(f"Removing source '{self.source.id}' from project.")
-        if hasattr(self.controller.project_controller, "remove_source_from_project"):
-            self.controller.project_controller.remove_source_from_project(self.source.id)
-        if e.control.page:
-            e.control.page.update()
\ No newline at end of file
+        self.logger.info("Removing source '%s' from project.", self.source.id)
+        # The controller refreshes the view and updates the page
+        self.controller.project_controller.remove_source_from_project(self.source.id)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import flet as ft
 from pathlib import Path
-from models.user_config_models import RecentProject
+from src.models.user_config_models import RecentProject
 # Assuming you have a BaseCard component as discussed previously
 from .base_card import BaseCard 
 
@@ -73,9 +73,9 @@ class RecentProjectCard(BaseCard):
             ink=True,
         )
 
-    def _handle_open_project(self, e):
+    async def _handle_open_project(self, e):
         """Callback to open the project via the controller."""
-        self.controller.project_controller.open_project(Path(self.project.path))
+        await self.controller.project_controller.open_project(Path(self.project.path))
 
     def _handle_remove_project(self, e):
         """
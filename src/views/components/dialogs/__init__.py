@@ -1,11 +1,27 @@
 """Dialog components for the project manager"""
 
-from .project_creation_dialog import ProjectCreationDialog
-from .folder_creation_dialog import FolderCreationDialog
-from .first_time_setup_dialog import FirstTimeSetupDialog
-from .source_creation_dialog import SourceCreationDialog
-from .source_editor_dialog import SourceEditorDialog
-from .add_source_to_project_dialog import AddSourceToProjectDialog
+from utils.lazy_imports import lazy_exports
+
+# Dialogs are imported lazily (PEP 562) the first time each one is accessed
+_LAZY_IMPORTS = {
+    "AddSourceToProjectDialog": ".add_source_to_project_dialog",
+    "ProjectCreationDialog": ".project_creation_dialog",
+    "FolderCreationDialog": ".folder_creation_dialog",
+    "FirstTimeSetupDialog": ".first_time_setup_dialog",
+    "SourceCreationDialog": ".source_creation_dialog",
+    "SourceEditorDialog": ".source_editor_dialog",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
+
+def preload():
+    """Imports every dialog module now, e.g. from a background thread while the app is idle."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
 
 __all__ = [
     "AddSourceToProjectDialog",
@@ -13,6 +13,11 @@ from typing import Callable, Dict, Any, List, Optional
 from config import get_dialog_fields, get_project_type_display_names
 from utils.validators import create_validated_field, validate_form_data
 
+# Project types are static config, so resolve the (code, display name) pairs once.
+# The ft.dropdown.Option controls themselves are still built per dialog, since a
+# Flet control can only be attached to one parent.
+_PROJECT_TYPE_CHOICES = tuple(get_project_type_display_names().items())
+
 class ProjectCreationDialog:
     """A dialog for collecting new project information dynamically."""
 
@@ -74,12 +79,11 @@ class ProjectCreationDialog:
 
     def _build_project_type_dropdown(self) -> ft.Dropdown:
         """Builds the project type dropdown."""
-        project_types = get_project_type_display_names()
         return ft.Dropdown(
             label="Project Type *",
             options=[
                 ft.dropdown.Option(key=code, text=name)
-                for code, name in project_types.items()
+                for code, name in _PROJECT_TYPE_CHOICES
             ],
             on_change=self._on_project_type_change,
             autofocus=True,
@@ -130,7 +134,7 @@ class ProjectCreationDialog:
 
         is_valid, errors = validate_form_data(project_type, form_data)
         if not is_valid:
-            self.logger.warning(f"Form validation failed: {errors}")
+            self.logger.warning("Form validation failed: %s", errors)
             error_dialog = ft.AlertDialog(
                 title=ft.Text("Validation Errors"),
                 content=ft.Text("\n".join(errors)),
@@ -1,5 +1,5 @@
 import flet as ft
-from models import SourceRecord
+from src.models import SourceRecord
 # Import the new generator function
 from utils.citation_generator import generate_citation
 
@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Any, Callable
 from config.source_types_config import get_fields_for_source_type, SourceFieldConfig
 from config.project_types_config import FieldConfig, ValidationRule
 
-from models.source_models import SourceType
+from src.models.source_models import SourceType
 
 from utils import create_validated_field, generate_source_title
 
@@ -137,7 +137,7 @@ class SourceCreationDialog:
 
     def _on_source_type_change(self, e: ft.ControlEvent):
         """Dynamically update the form fields when the source type changes."""
-        self.logger.info(f"Source type changed to: {e.control.value}")
+        self.logger.info("Source type changed to: %s", e.control.value)
         if e.control.value:
             self._populate_dynamic_fields(e.control.value)
 
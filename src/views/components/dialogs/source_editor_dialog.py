@@ -10,8 +10,8 @@ from dataclasses import dataclass
 
 from config.source_types_config import get_fields_for_source_type, SourceFieldConfig
 from config.project_types_config import FieldConfig, ValidationRule, FieldType
-from models.source_models import SourceRecord
-from models.project_models import ProjectSourceLink
+from src.models.source_models import SourceRecord
+from src.models.project_models import ProjectSourceLink
 from utils.validators import create_validated_field
 
 @dataclass
@@ -145,8 +145,8 @@ class SourceEditorDialog:
             "declassify": self.declassify_field.value or "",
         }
 
-        self.logger.debug(f"Master data to save: {master_data}")
-        self.logger.debug(f"Link data to save: {link_data}")
+        self.logger.debug("Master data to save: %s", master_data)
+        self.logger.debug("Link data to save: %s", link_data)
 
         # Execute the callback with all necessary data
         self.on_save(self.source.id, master_data, link_data)
@@ -3,16 +3,6 @@ from typing import TYPE_CHECKING
 
 from .components.app_bar import AppBar as SourceManagerAppBar
 from .components.sidebar import Sidebar
-from .pages import (
-    HomeView,
-    RecentProjectsView,
-    NewProjectView,
-    ProjectView,
-    SourcesView,
-    ReportsView,
-    SettingsView,
-    HelpView,
-)
 from .base_view import BaseView
 
 from config.app_config import PAGES
@@ -118,17 +108,7 @@ class MainView(BaseView):
         Returns:
             type: The view class corresponding to the page name, or None if not found.
         """
-        view_map = {
-            "home": HomeView,
-            "recent_projects": RecentProjectsView,
-            "new_project": NewProjectView,
-            "project_dashboard": ProjectView,
-            "sources": SourcesView,
-            "reports": ReportsView,
-            "settings": SettingsView,
-            "help": HelpView,
-        }
-        return view_map.get(page_name)
+        return self.controller.navigation_controller.get_view_class(page_name)
 
     def refresh_theme(self):
         """
@@ -141,7 +121,7 @@ class MainView(BaseView):
             else ft.ThemeMode.LIGHT
         )
         self.page.theme = self.controller.theme_manager.get_theme_data()
-        self.page.update()
+        self.controller.update_page()
 
     def update_greeting(self):
         """
@@ -149,6 +129,9 @@ class MainView(BaseView):
         """
         new_greeting = self.controller.settings_manager.get_greeting()
         self.app_bar.update_greeting(new_greeting)
+        # The .page attribute is only set once the app bar has been added to the page
+        if self.app_bar.page:
+            self.controller.update_page()
 
     def show(self):
         """
@@ -157,7 +140,18 @@ class MainView(BaseView):
         self.page.appbar = self.app_bar
         self.page.controls.clear()
         self.page.add(self.main_layout)
-        self.page.update()
+        self.controller.update_page()
+
+    def transition_to(self, content: ft.Control, page_name: str):
+        """
+        Shows a page's content and selects it in the sidebar, then updates the page once.
+        Args:
+            content (ft.Control): The control to display in the content area.
+            page_name (str): The name of the page being shown.
+        """
+        self.set_content(content)
+        self.update_navigation(page_name)
+        self.controller.update_page()
 
     def update_navigation(self, page_name: str):
         """
@@ -1,13 +1,29 @@
-from .help_view import HelpView
-from .home_view import HomeView
-from .new_project_view import NewProjectView
-from .project_view import ProjectView
-from .recent_projects_view import RecentProjectsView
-from .reports_view import ReportsView
-from .settings_view import SettingsView
-from .sources_view import SourcesView
+"""
+Page views for the application.
+
+Each page class is imported lazily (PEP 562) the first time it is accessed,
+so importing this package does not pull in every page and its dependencies.
+"""
+
+from utils.lazy_imports import lazy_exports
+
+# Maps each exported page class to the submodule that defines it
+_LAZY_IMPORTS = {
+    "HelpView": ".help_view",
+    "HomeView": ".home_view",
+    "NewProjectView": ".new_project_view",
+    "ProjectView": ".project_view",
+    "RecentProjectsView": ".recent_projects_view",
+    "ReportsView": ".reports_view",
+    "SettingsView": ".settings_view",
+    "SourcesView": ".sources_view",
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "HomeView", "RecentProjectsView", "NewProjectView", "ProjectView",
     "SettingsView", "SourcesView", "ReportsView", "HelpView"
-]
\ No newline at end of file
+]
@@ -11,6 +11,7 @@ from pathlib import Path
 import logging
 from src.views.base_view import BaseView
 from src.views.components.breadcrumb import Breadcrumb
+from utils.debounce import debounce
 
 
 class NewProjectView(BaseView):
@@ -24,6 +25,9 @@ class NewProjectView(BaseView):
         # --- UI State ---
         self.current_path: Path = Path(self.controller.directory_service.project_data_dir)
         self.search_text: str = ""
+        # Coalesce rapid keystrokes so the recursive folder search runs once per burst;
+        # the search runs on the page's event loop and is cancelled when the user moves on
+        self._debounced_search = debounce(page, self._run_pending_search)
 
         # --- UI Component Placeholders ---
         self.breadcrumb: Optional[Breadcrumb] = None
@@ -123,7 +127,7 @@ class NewProjectView(BaseView):
             border_color=ft.colors.OUTLINE,
             content_padding=10,
             on_change=self._on_search_change,
-            on_submit=self._on_search_change,
+            on_submit=self._on_search_submit,
             disabled=True,  # Disabled until country is selected
         )
 
@@ -167,13 +171,28 @@ class NewProjectView(BaseView):
 
     # --- Event Handlers ---
     def _on_search_change(self, e):
-        """Handle search field changes."""
-        search_value = e.control.value if e.control.value else ""
+        """Handle search field changes, debounced while the user is typing."""
+        self._debounced_search(e.control.value or "")
+
+    def _on_search_submit(self, e):
+        """Handle search submission immediately."""
+        self._debounced_search.cancel()
+        self._run_search(e.control.value or "")
+
+    def _run_pending_search(self, search_value: str):
+        """Runs a debounced search, unless the user has left this page since typing."""
+        if self.controller.navigation_manager.get_current_page() != "new_project":
+            return
+        self._run_search(search_value)
+
+    def _run_search(self, search_value: str):
+        """Runs the progressive search and refreshes the view."""
         self.browser_manager.search(search_value)
         self.update_view()
 
     def _on_country_selected(self, e):
         """Handle country selection from dropdown."""
+        self._debounced_search.cancel()
         if e.control.value:
             # Country selected - navigate to it and enable search
             self.browser_manager.select_country(e.control.value)
@@ -189,6 +208,7 @@ class NewProjectView(BaseView):
 
     def _on_breadcrumb_clicked(self, index: int):
         """Handle breadcrumb navigation."""
+        self._debounced_search.cancel()
         parts = self.browser_manager.breadcrumb_parts
 
         if index == 0:  # Clicked on "Projects" - go to root
@@ -208,23 +228,26 @@ class NewProjectView(BaseView):
 
     def _on_back_clicked(self, e):
         """Handles the back button click to navigate to the home view."""
+        self._debounced_search.cancel()
         self.controller.navigate_to("home")
 
     def _on_recent_projects_clicked(self, e):
         """Handles the recent projects button click."""
+        self._debounced_search.cancel()
         self.controller.navigate_to("recent_projects")
 
-    def _on_item_clicked(self, e):
+    async def _on_item_clicked(self, e):
         """Handles a click on a file or folder in the list."""
+        self._debounced_search.cancel()
         try:
             item_data = e.control.data
             self.logger.info(
-                f"--- _on_item_clicked: Item clicked. Raw data: {item_data} ---"
+                "--- _on_item_clicked: Item clicked. Raw data: %s ---", item_data
             )
 
             if not isinstance(item_data, dict):
                 self.logger.error(
-                    f"--- _on_item_clicked: ERROR! Item data is not a dictionary. Type is {type(item_data)} ---"
+                    "--- _on_item_clicked: ERROR! Item data is not a dictionary. Type is %s ---", type(item_data)
                 )
                 return
 
@@ -233,14 +256,14 @@ class NewProjectView(BaseView):
 
             if item_path_str is None or is_directory is None:
                 self.logger.error(
-                    f"--- _on_item_clicked: ERROR! Item data is missing 'path' or 'is_directory'. ---"
+                    "--- _on_item_clicked: ERROR! Item data is missing 'path' or 'is_directory'. ---"
                 )
                 return
 
             item_path = Path(item_path_str)
             if is_directory:
                 self.logger.info(
-                    f"--- _on_item_clicked: Navigating to directory: {item_path} ---"
+                    "--- _on_item_clicked: Navigating to directory: %s ---", item_path
                 )
 
                 # Clear search when navigating to avoid confusion
@@ -256,13 +279,13 @@ class NewProjectView(BaseView):
                 self.update_view()
             else:
                 self.logger.info(
-                    f"--- _on_item_clicked: Calling controller.open_project with path: {item_path} ---"
+                    "--- _on_item_clicked: Calling controller.open_project with path: %s ---", item_path
                 )
-                self.controller.project_controller.open_project(item_path)
+                await self.controller.project_controller.open_project(item_path)
 
         except Exception as ex:
             self.logger.error(
-                f"--- _on_item_clicked: An unexpected exception occurred: {ex} ---",
+                "--- _on_item_clicked: An unexpected exception occurred: %s ---", ex,
                 exc_info=True,
             )
 
@@ -315,7 +338,7 @@ class NewProjectView(BaseView):
         self._update_action_button()
         self._update_file_list()
         if hasattr(self, "page") and self.page:
-            self.page.update()
+            self.controller.update_page()
 
     def _update_file_list(self):
         """Fetches folder contents and filters them based on the search text."""
@@ -340,21 +363,27 @@ class NewProjectView(BaseView):
                 self.show_empty_state(message, icon=icon)
             )
         else:
-            for item in items:
-                icon = (
-                    ft.icons.FOLDER_OUTLINED
-                    if item["is_directory"]
-                    else ft.icons.INSERT_DRIVE_FILE_OUTLINED
-                )
-                self.file_list_view.controls.append(
-                    ft.ListTile(
-                        leading=ft.Icon(icon, color=ft.colors.TERTIARY),
-                        title=ft.Text(item["name"]),
-                        on_click=self._on_item_clicked,
-                        data=item,
-                        bgcolor=ft.colors.TERTIARY_CONTAINER,
-                    )
+            # Hoist the per-row constants; Flet controls can't be shared between
+            # parents, so only the Icon/Text/ListTile objects are created per row.
+            folder_icon = ft.icons.FOLDER_OUTLINED
+            file_icon = ft.icons.INSERT_DRIVE_FILE_OUTLINED
+            icon_color = ft.colors.TERTIARY
+            tile_bgcolor = ft.colors.TERTIARY_CONTAINER
+            on_click = self._on_item_clicked
+
+            self.file_list_view.controls.extend(
+                ft.ListTile(
+                    leading=ft.Icon(
+                        folder_icon if item["is_directory"] else file_icon,
+                        color=icon_color,
+                    ),
+                    title=ft.Text(item["name"]),
+                    on_click=on_click,
+                    data=item,
+                    bgcolor=tile_bgcolor,
                 )
+                for item in items
+            )
 
     def _update_country_dropdown_from_path(self, current_path: Path):
         """Updates the country dropdown to reflect the current path location."""
@@ -27,25 +27,30 @@ class ProjectView(BaseView):
         self.project_state_manager = self.controller.project_state_manager
         
         self.logger.debug("Creating tab instances")
-        
+
+        # A tab stays None if it fails to initialize
+        self.metadata_tab = None
+        self.sources_tab = None
+        self.cite_sources_tab = None
+
         # Initialize all tab view classes, passing the controller to each
         try:
             self.metadata_tab = ProjectMetadataTab(controller=self.controller)
             self.logger.debug("✅ MetadataTab initialized")
         except Exception as e:
-            self.logger.error(f"❌ MetadataTab initialization failed: {e}")
+            self.logger.error("❌ MetadataTab initialization failed: %s", e)
             
         try:
             self.sources_tab = ProjectSourcesTab(controller=self.controller)
             self.logger.debug("✅ SourcesTab initialized")
         except Exception as e:
-            self.logger.error(f"❌ SourcesTab initialization failed: {e}")
+            self.logger.error("❌ SourcesTab initialization failed: %s", e)
             
         try:
             self.cite_sources_tab = CiteSourcesTab(controller=self.controller)
             self.logger.debug("✅ CiteSourcesTab initialized")
         except Exception as e:
-            self.logger.error(f"❌ CiteSourcesTab initialization failed: {e}")
+            self.logger.error("❌ CiteSourcesTab initialization failed: %s", e)
             
         self.tabs_control = None # Placeholder for the ft.Tabs control
         self.logger.info("ProjectView initialization complete")
@@ -63,7 +68,7 @@ class ProjectView(BaseView):
             self.logger.warning("No project loaded - showing error message")
             return self.show_error("No project is currently loaded.")
 
-        self.logger.info(f"Building view for project: {project.project_title}")
+        self.logger.info("Building view for project: %s", project.project_title)
         
         # Determine the starting tab index
         nav_manager = self.controller.navigation_manager
@@ -78,7 +83,7 @@ class ProjectView(BaseView):
             self.update_view()
             self.logger.debug("✅ Tab views updated successfully")
         except Exception as e:
-            self.logger.error(f"❌ Failed to update tab views: {e}")
+            self.logger.error("❌ Failed to update tab views: %s", e)
             return self.show_error(f"Error loading project data: {e}")
 
         project_info = f"Project: {project.project_title}"
@@ -145,13 +150,12 @@ class ProjectView(BaseView):
         if not project:
             return
 
-        # Call the update method on the child tabs that need refreshing
-        if hasattr(self, 'metadata_tab') and hasattr(self.metadata_tab, 'update_project_data'):
-            self.metadata_tab.update_project_data(project.metadata, str(project.file_path))
-        
-        if hasattr(self, 'sources_tab') and hasattr(self.sources_tab, 'update_project_data'):
-            self.sources_tab.update_project_data(project.metadata, str(project.file_path))
-        
+        # Every BaseTab provides update_project_data(), so only a failed tab is skipped
+        project_path = str(project.file_path)
+        for tab in (self.metadata_tab, self.sources_tab):
+            if tab is not None:
+                tab.update_project_data(project.metadata, project_path)
+
         # Update the cite sources tab as well
-        if hasattr(self, 'cite_sources_tab') and hasattr(self.cite_sources_tab, 'update_view'):
-            self.cite_sources_tab.update_view()
\ No newline at end of file
+        if self.cite_sources_tab is not None:
+            self.cite_sources_tab.update_view()
@@ -1,7 +1,9 @@
+import asyncio
+
 import flet as ft
 from .base_tab import BaseTab
 from typing import List
-from views.components import SlideCarousel
+from src.views.components import SlideCarousel
 import logging
 
 
@@ -24,6 +26,8 @@ class CiteSourcesTab(BaseTab):
         """
         super().__init__(controller)
         self.current_slide_id: Optional[str] = None
+        # True while a background sync with the .pptx file is running
+        self._sync_in_progress = False
 
         # --- UI Components ---
         self.slide_carousel = SlideCarousel(on_slide_selected=self._on_slide_selected)
@@ -229,19 +233,40 @@ class CiteSourcesTab(BaseTab):
     def _show_create_group_dialog(self, e):
         """Placeholder for showing a dialog to group sources."""
         # Future implementation: show a dialog to create a source group.
-        if self.page:
-            self.page.show_snack_bar(ft.SnackBar(ft.Text("Grouping not yet implemented."), open=True))
+        self.controller.show_info_message("Grouping not yet implemented.")
 
 
     def update_view(self):
         """
         Refreshes the entire view based on the current project state.
         This is the main method for synchronizing the UI with the data model.
+        The saved slide data is shown right away; the sync with the .pptx file
+        runs in the background and the view is redrawn only if the slides changed.
         """
         project = self.controller.project_controller.get_current_project()
         if not project: return
 
-        self.controller.powerpoint_controller.get_synced_slide_data()
+        self._render(project)
+        if not self._sync_in_progress and self.page:
+            self._sync_in_progress = True
+            self.page.run_task(self._sync_slides, project)
+
+    async def _sync_slides(self, project):
+        """Re-reads the linked .pptx off the UI thread and redraws if its slides changed."""
+        try:
+            slides_before = project.metadata.get("slide_data", [])
+            await asyncio.to_thread(
+                self.controller.powerpoint_controller.get_synced_slide_data
+            )
+        finally:
+            self._sync_in_progress = False
+
+        current = self.controller.project_controller.get_current_project()
+        if current is project and project.metadata.get("slide_data", []) != slides_before:
+            self._render(project)
+
+    def _render(self, project):
+        """Fills the carousel and source lists from the project's saved slide data."""
         slides = project.metadata.get("slide_data", [])
         has_slides = bool(slides)
 
@@ -249,7 +274,7 @@ class CiteSourcesTab(BaseTab):
         self.main_view.visible = has_slides
 
         if not has_slides:
-            if self.page: self.page.update()
+            if self.page: self.controller.update_page()
             return
         
         if not self.current_slide_id and slides:
@@ -288,7 +313,7 @@ class CiteSourcesTab(BaseTab):
                 else:
                     self.available_list.controls.append(checkbox)
 
-        if self.page: self.page.update()
+        if self.page: self.controller.update_page()
 
     def _request_pptx_association(self, e):
         """
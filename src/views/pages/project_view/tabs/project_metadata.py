@@ -60,7 +60,7 @@ class ProjectMetadataTab(BaseTab):
             # No project loaded: show a message
             self.form_container.content = ft.Text("No project loaded.", italic=True)
             if self.page:
-                self.page.update()
+                self.controller.update_page()
             return
 
         project_type_code = project.project_type.value
@@ -141,7 +141,7 @@ class ProjectMetadataTab(BaseTab):
         )
 
         if self.controller.page:
-            self.controller.page.update()
+            self.controller.update_page()
 
     def _extract_form_data(self, project) -> Dict[str, Any]:
         """
@@ -191,8 +191,10 @@ class ProjectMetadataTab(BaseTab):
                 else:
                     updated_data[name] = control.value
         
-        # Delegate the update logic to the project controller
-        self.controller.project_controller.update_project_metadata(updated_data)
+        # Delegate the update logic to the project controller; it saves off the UI thread
+        self.page.run_task(
+            self.controller.project_controller.update_project_metadata, updated_data
+        )
 
     def update_project_data(self, project_data: Dict[str, Any], project_path: str):
         """
@@ -202,7 +204,7 @@ class ProjectMetadataTab(BaseTab):
             project_data (Dict[str, Any]): The new project data.
             project_path (str): The path to the new project file.
         """
-        self.logger.info(f"Updating project data for path: {project_path}")
+        self.logger.info("Updating project data for path: %s", project_path)
         self.is_edit_mode = False
         if hasattr(self, "action_button"):
             self.action_button.text = "Edit"
@@ -1,8 +1,8 @@
 import flet as ft
 from typing import Dict, Any
 from .base_tab import BaseTab
-from views.components import ProjectSourceCard, OnDeckCard
-from views.components.dialogs import AddSourceToProjectDialog
+from src.views.components import ProjectSourceCard, OnDeckCard
+from src.views.components.dialogs import AddSourceToProjectDialog
 
 
 class ProjectSourcesTab(BaseTab):
@@ -167,7 +167,7 @@ class ProjectSourcesTab(BaseTab):
             )
 
         if self.page:
-            self.page.update()
+            self.controller.update_page()
 
     def _drag_will_accept(self, e: ft.DragTargetAcceptEvent):
         """Provides visual feedback by modifying the target control's appearance."""
@@ -196,20 +196,18 @@ class ProjectSourcesTab(BaseTab):
             return
 
         source_links = project.sources
-        dragged_link = next(
-            (link for link in source_links if link.source_id == src_id_being_dragged),
-            None,
-        )
-
-        target_index = -1
+        # Find both positions in one pass over the links
+        dragged_index = target_index = -1
         for i, link in enumerate(source_links):
-            if link.source_id == target_id:
+            if link.source_id == src_id_being_dragged:
+                dragged_index = i
+            elif link.source_id == target_id:
                 target_index = i
+            if dragged_index != -1 and target_index != -1:
                 break
 
-        if dragged_link and target_index != -1:
-            source_links.remove(dragged_link)
-            source_links.insert(target_index, dragged_link)
+        if dragged_index != -1 and target_index != -1:
+            source_links.insert(target_index, source_links.pop(dragged_index))
             self.controller.project_service.save_project(project)
             self._update_view()
         else:
@@ -221,10 +219,10 @@ class ProjectSourcesTab(BaseTab):
 
     def _show_add_to_project_dialog(self, source_id: str):
         def on_save(notes: str, declassify: str):
+            # The controller refreshes the project view, this tab included
             self.controller.source_controller.add_source_to_project(
                 source_id, {"usage_notes": notes, "declassify_info": declassify}
             )
-            self._update_view()
 
         dialog = AddSourceToProjectDialog(page=self.page, on_save=on_save)
         dialog.show()
@@ -1,6 +1,6 @@
 import flet as ft
 from ..base_view import BaseView
-from models.user_config_models import RecentProject
+from src.models.user_config_models import RecentProject
 from typing import List
 import logging
 
@@ -15,24 +15,36 @@ class RecentProjectsView(BaseView):
         super().__init__(page, controller)
         self.user_config_manager = self.controller.user_config_manager
         self.logger = logging.getLogger(__name__)
+        # The root container from the last build(), refilled by update_view()
+        self._root = None
 
     def build(self) -> ft.Control:
         """Builds the UI for the recent projects view."""
-        recent_projects = self.user_config_manager.get_recent_projects()
-
-        return ft.Container(
-            content=ft.Column(
-                controls=[
-                    self._build_header(len(recent_projects)),
-                    self._build_content(recent_projects),
-                ],
-                expand=True,
-                spacing=0,
-            ),
+        self._root = ft.Container(
+            content=self._build_body(),
             padding=ft.padding.all(20),
             expand=True,
         )
-        # --- END FIX ---
+        return self._root
+
+    def update_view(self):
+        """Rebuilds the list in place after the recent projects change, without navigating."""
+        if self._root is None:
+            return
+        self._root.content = self._build_body()
+        self.controller.update_page()
+
+    def _build_body(self) -> ft.Column:
+        """Builds the header and list for the current recent projects."""
+        recent_projects = self.user_config_manager.get_recent_projects()
+        return ft.Column(
+            controls=[
+                self._build_header(len(recent_projects)),
+                self._build_content(recent_projects),
+            ],
+            expand=True,
+            spacing=0,
+        )
 
     def _build_header(self, count: int) -> ft.Container:
         """Builds the header section of the view."""
@@ -23,6 +23,10 @@ class ReportsView(BaseView):
         self.word_path_display: Optional[ft.Text] = None
         self.ppt_path_display: Optional[ft.Text] = None
 
+        # One save-file picker per view, added to the overlay on first use
+        self._export_picker: Optional[ft.FilePicker] = None
+        self._picking_export_type: Optional[str] = None
+
     def build(self) -> ft.Control:
         """Build the modern reports view"""
         # Check if a project is loaded before building the main view
@@ -200,21 +204,25 @@ class ReportsView(BaseView):
         """Ask the controller to open a file picker for the export location."""
         # The controller will handle the FilePicker logic and call back to update the path
         # Example: self.controller.export_controller.pick_export_path(export_type, self.update_export_path)
-        def on_path_selected(path: Optional[str]):
-            if path:
-                self.update_export_path(export_type, path)
-
         # This is a simplified stand-in for the controller's file picker logic
-        file_picker = ft.FilePicker(on_result=lambda e: on_path_selected(e.path if e.path else None))
-        self.page.overlay.append(file_picker)
-        self.page.update()
+        if self._export_picker is None:
+            self._export_picker = ft.FilePicker(on_result=self._on_export_path_picked)
+            self.page.overlay.append(self._export_picker)
+            self.page.update()
+        self._picking_export_type = export_type
         ext = "docx" if export_type == "word" else "pptx"
-        file_picker.save_file(
+        self._export_picker.save_file(
             dialog_title=f"Choose {export_type.title()} export location",
             file_name=f"bibliography.{ext}",
             allowed_extensions=[ext]
         )
 
+    def _on_export_path_picked(self, e: ft.FilePickerResultEvent):
+        """Records the location chosen for the export the picker was opened for."""
+        export_type, self._picking_export_type = self._picking_export_type, None
+        if e.path and export_type:
+            self.update_export_path(export_type, e.path)
+
     def update_export_path(self, export_type: str, path: str):
         """Callback for the controller to update the UI with the selected path."""
         self.export_paths[export_type] = path
@@ -247,4 +255,4 @@ class ReportsView(BaseView):
         self._init_components()
         # Re-build the entire view content
         self.controls[0] = self.build()
-        self.page.update()
\ No newline at end of file
+        self.controller.update_page()
\ No newline at end of file
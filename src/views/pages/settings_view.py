@@ -27,6 +27,7 @@ class SettingsView(BaseView):
         """
         # Use the safe 'self.colors' property, which is guaranteed to exist.
         colors = self.colors
+        self._appearance_section = self._build_appearance_section(colors)
 
         # Build the main settings page layout
         return ft.Container(
@@ -39,7 +40,7 @@ class SettingsView(BaseView):
                     ),
                     ft.Divider(height=20),
                     self._build_display_name_section(),
-                    self._build_appearance_section(colors),
+                    self._appearance_section,
                     # Future settings sections...
                 ],
                 spacing=15,
@@ -49,6 +50,17 @@ class SettingsView(BaseView):
             expand=True,
         )
 
+    def refresh_theme(self):
+        """
+        Rebuilds only the appearance controls so the mode icon and selected color
+        reflect the new theme, leaving the rest of the page untouched.
+        """
+        appearance_section = getattr(self, "_appearance_section", None)
+        if appearance_section is not None:
+            appearance_section.controls = self._build_appearance_section(
+                self.colors
+            ).controls
+
     def _build_appearance_section(self, colors) -> ft.Column:
         """
         Builds the UI controls for the 'Appearance' settings, including theme mode and color.
@@ -132,11 +144,13 @@ class SettingsView(BaseView):
                 feedback_text.visible = True
             else:
                 new_name = new_name.strip()
-                self.controller.settings_controller.save_display_name(new_name)
-                feedback_text.value = "Display name updated successfully."
-                feedback_text.color = ft.colors.GREEN
-                feedback_text.visible = True
-                self.page.update()
+                # The greeting and the feedback text go out in one page update
+                with self.controller.batched_update():
+                    self.controller.settings_controller.save_display_name(new_name)
+                    feedback_text.value = "Display name updated successfully."
+                    feedback_text.color = ft.colors.GREEN
+                    feedback_text.visible = True
+                    self.controller.update_page()
 
         # Save button for display name
         save_button = ft.ElevatedButton(
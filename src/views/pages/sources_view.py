@@ -1,7 +1,7 @@
 import flet as ft
 from typing import Dict, List
 from ..base_view import BaseView
-from models.source_models import SourceRecord
+from src.models.source_models import SourceRecord
 from ..components.cards.on_deck_card import OnDeckCard
 from config.source_types_config import get_filterable_fields
 
@@ -143,7 +143,7 @@ class SourcesView(BaseView):
 
         # Update the page to show the changes.
         if self.page:
-            self.page.update()
+            self.controller.update_page()
 
     def _populate_country_dropdown(self):
         """Populates the country dropdown using data from the SourceController."""
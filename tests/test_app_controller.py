@@ -0,0 +1,153 @@
+import threading
+
+import flet as ft
+
+from src.controllers.app_controller import AppController, _BatchState
+from src.views.base_view import BaseView
+
+
+class FakePage:
+    """Counts page.update() calls instead of talking to a Flet client."""
+
+    def __init__(self):
+        self.updates = 0
+
+    def update(self, *controls):
+        self.updates += 1
+
+
+def make_controller():
+    # Only the state batched_update() and the SnackBar touch; the services and views are not needed
+    controller = AppController.__new__(AppController)
+    controller.page = FakePage()
+    controller._batch = _BatchState()
+    controller._snack_text = ft.Text("")
+    controller._snack_bar = ft.SnackBar(content=controller._snack_text)
+    controller._snack_lock = threading.Lock()
+    controller.views = {}
+    return controller
+
+
+class FakeView(BaseView):
+    """Counts update_view() calls; each one asks the controller for a page update."""
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.refreshes = 0
+
+    def build(self):
+        return ft.Container()
+
+    def update_view(self):
+        self.refreshes += 1
+        self.controller.update_page()
+
+
+def test_view_refreshes_in_a_batch_run_once_per_page():
+    controller = make_controller()
+    sources = controller.views["sources"] = FakeView(controller)
+    reports = controller.views["reports"] = FakeView(controller)
+
+    with controller.batched_update():
+        controller.update_view("sources")
+        with controller.batched_update():
+            controller.update_view("sources")
+            controller.update_view("reports")
+        controller.update_view("sources")
+        assert sources.refreshes == 0
+
+    assert sources.refreshes == 1
+    assert reports.refreshes == 1
+    assert controller.page.updates == 1
+
+
+def test_update_page_outside_a_batch_updates_immediately():
+    controller = make_controller()
+
+    controller.update_page()
+    controller.update_page()
+
+    assert controller.page.updates == 2
+
+
+def test_nested_batches_send_one_update():
+    controller = make_controller()
+
+    with controller.batched_update():
+        controller.update_page()
+        with controller.batched_update():
+            controller.update_page()
+            controller.update_page()
+        assert controller.page.updates == 0
+        controller.update_page()
+
+    assert controller.page.updates == 1
+
+
+def test_batch_without_updates_sends_nothing():
+    controller = make_controller()
+
+    with controller.batched_update():
+        pass
+
+    assert controller.page.updates == 0
+
+
+def test_batch_only_defers_updates_from_its_own_thread():
+    controller = make_controller()
+
+    with controller.batched_update():
+        worker = threading.Thread(target=controller.update_page)
+        worker.start()
+        worker.join()
+        assert controller.page.updates == 1
+        controller.update_page()
+
+    assert controller.page.updates == 2
+
+
+def test_success_in_a_batch_does_not_replace_a_pending_error():
+    controller = make_controller()
+
+    with controller.batched_update():
+        controller.show_error_message("Failed to add source to project.")
+        controller.show_success_message("Source created successfully.")
+
+    assert controller._snack_text.value == "Failed to add source to project."
+    assert controller._snack_bar.bgcolor == ft.colors.RED
+    assert controller.page.updates == 1
+
+
+def test_success_after_a_batch_is_shown_again():
+    controller = make_controller()
+
+    with controller.batched_update():
+        controller.show_error_message("Failed to add source to project.")
+    controller.show_success_message("Source created successfully.")
+
+    assert controller._snack_text.value == "Source created successfully."
+
+
+class FakeSnackBar:
+    """Records the open state each time the bar itself is sent to the client."""
+
+    def __init__(self):
+        self.open = False
+        self.bgcolor = None
+        self.page = object()
+        self.sent = []
+
+    def update(self):
+        self.sent.append(self.open)
+
+
+def test_open_bar_is_closed_before_it_is_shown_again():
+    controller = make_controller()
+    controller._snack_bar = FakeSnackBar()
+
+    controller.show_success_message("Saved.")
+    controller.show_success_message("Saved again.")
+
+    assert controller._snack_bar.sent == [False]
+    assert controller._snack_bar.open is True
+    assert controller.page.updates == 2
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.debounce import debounce
+
+
+class FakePage:
+    """Runs page.run_task coroutines on an event loop in a background thread, like Flet does."""
+
+    def __init__(self, loop):
+        self.loop = loop
+
+    def run_task(self, handler, *args):
+        return asyncio.run_coroutine_threadsafe(handler(*args), self.loop)
+
+
+@pytest.fixture
+def page():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield FakePage(loop)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_rapid_calls_run_once_with_last_arguments(page):
+    calls = []
+    search = debounce(page, calls.append, delay=0.05)
+
+    for value in ("a", "ab", "abc"):
+        search(value)
+    time.sleep(0.3)
+
+    assert calls == ["abc"]
+
+
+def test_cancel_drops_pending_call(page):
+    calls = []
+    search = debounce(page, calls.append, delay=0.05)
+
+    search("abc")
+    search.cancel()
+    time.sleep(0.3)
+
+    assert calls == []
+
+
+def test_call_runs_on_the_page_loop(page):
+    threads = []
+    search = debounce(page, lambda: threads.append(threading.current_thread()), delay=0.01)
+
+    search()
+    time.sleep(0.2)
+
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
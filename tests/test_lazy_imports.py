@@ -0,0 +1,50 @@
+import sys
+import types
+
+import pytest
+
+from utils.lazy_imports import lazy_exports
+
+
+@pytest.fixture
+def package():
+    """A throwaway package exporting names from stdlib modules lazily."""
+    module = types.ModuleType("lazy_test_package")
+    module.__getattr__, module.__dir__ = lazy_exports(
+        module.__name__,
+        vars(module),
+        {"dedent": "textwrap", "json": "json"},
+    )
+    sys.modules[module.__name__] = module
+    yield module
+    del sys.modules[module.__name__]
+
+
+def test_name_resolves_on_first_access_and_is_cached(package):
+    import textwrap
+
+    assert "dedent" not in vars(package)
+    assert package.dedent is textwrap.dedent
+    assert vars(package)["dedent"] is textwrap.dedent
+
+
+def test_import_modules_resolves_to_the_module():
+    import json
+
+    namespace = {}
+    getattr_, _ = lazy_exports("lazy_test_modules", namespace, {"json": "json"}, import_modules=True)
+
+    assert getattr_("json") is json
+    assert namespace["json"] is json
+
+
+def test_unknown_name_raises_attribute_error(package):
+    with pytest.raises(AttributeError, match="missing"):
+        package.missing
+
+
+def test_dir_lists_the_lazy_exports(package):
+    names = dir(package)
+
+    assert "dedent" in names
+    assert "json" in names
@@ -0,0 +1,90 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.controllers import navigation_controller
+from src.controllers.navigation_controller import NavigationController, RECENT_PROJECT_CHECK_TTL
+from src.managers.user_config_manager import UserConfigManager
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(navigation_controller.time, "monotonic", lambda: clock.now)
+    return clock
+
+
+@pytest.fixture
+def checks(monkeypatch):
+    """Records every path checked for existence."""
+    checks = []
+    real_exists = os.path.exists
+
+    def exists(path):
+        checks.append(path)
+        return real_exists(path)
+
+    monkeypatch.setattr(navigation_controller.os.path, "exists", exists)
+    return checks
+
+
+@pytest.fixture
+def navigation(tmp_path):
+    user_config_manager = UserConfigManager()
+    user_config_manager.config_dir = tmp_path
+    user_config_manager.config_file = tmp_path / "user.json"
+    user_config_manager.config.recent_projects = []
+    refreshed = []
+    controller = SimpleNamespace(
+        user_config_manager=user_config_manager,
+        update_view=refreshed.append,
+    )
+    navigation = NavigationController(controller)
+    navigation.refreshed = refreshed
+    return navigation
+
+
+def add_project(navigation, path):
+    navigation.controller.user_config_manager.add_recent_project(os.path.basename(path), str(path))
+
+
+def test_found_projects_are_not_checked_again_within_the_ttl(navigation, clock, checks, tmp_path):
+    project = tmp_path / "project.json"
+    project.write_text("{}")
+    add_project(navigation, project)
+
+    navigation._validate_recent_projects()
+    clock.now += RECENT_PROJECT_CHECK_TTL - 1
+    navigation._validate_recent_projects()
+
+    assert checks == [str(project)]
+
+
+def test_found_projects_are_checked_again_after_the_ttl(navigation, clock, checks, tmp_path):
+    project = tmp_path / "project.json"
+    project.write_text("{}")
+    add_project(navigation, project)
+
+    navigation._validate_recent_projects()
+    project.unlink()
+    clock.now += RECENT_PROJECT_CHECK_TTL
+    navigation._validate_recent_projects()
+
+    assert checks == [str(project), str(project)]
+    assert navigation.controller.user_config_manager.get_recent_projects() == []
+    assert navigation.refreshed == ["recent_projects"]
+
+
+def test_missing_projects_are_removed_with_one_refresh(navigation, clock, checks, tmp_path):
+    kept = tmp_path / "kept.json"
+    kept.write_text("{}")
+    add_project(navigation, kept)
+    add_project(navigation, tmp_path / "gone.json")
+    add_project(navigation, tmp_path / "also_gone.json")
+
+    navigation._validate_recent_projects()
+
+    remaining = navigation.controller.user_config_manager.get_recent_projects()
+    assert [p.path for p in remaining] == [str(kept)]
+    assert navigation.refreshed == ["recent_projects"]
@@ -0,0 +1,68 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.managers import powerpoint_manager
+from src.managers.powerpoint_manager import PowerPointManager
+
+
+class FakeSlide:
+    def __init__(self, slide_id, title):
+        self.slide_id = slide_id
+        self.shapes = SimpleNamespace(title=SimpleNamespace(text=title))
+
+
+@pytest.fixture
+def deck(monkeypatch):
+    """Stubs the .pptx loader and os.stat; returns the shared state the test can change."""
+    state = SimpleNamespace(mtime=100.0, loads=0)
+
+    def fake_presentation(path):
+        state.loads += 1
+        return SimpleNamespace(slides=[FakeSlide(256, "Introduction"), FakeSlide(257, "Findings")])
+
+    real_stat = os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        if str(path).endswith("deck.pptx"):
+            return os.stat_result((0o100644, 0, 0, 1, 0, 0, 0, 0, state.mtime, 0))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(powerpoint_manager, "Presentation", fake_presentation)
+    monkeypatch.setattr(os, "stat", fake_stat)
+    return state
+
+
+def test_file_is_parsed_once_while_its_mtime_is_unchanged(deck):
+    manager = PowerPointManager(controller=None)
+
+    first = manager.get_slides_from_file("/slides/deck.pptx")
+    second = manager.get_slides_from_file("/slides/deck.pptx")
+
+    assert deck.loads == 1
+    assert first == second == [
+        {"slide_id": 256, "title": "Introduction", "sources": []},
+        {"slide_id": 257, "title": "Findings", "sources": []},
+    ]
+
+
+def test_file_is_parsed_again_after_it_changes(deck):
+    manager = PowerPointManager(controller=None)
+
+    manager.get_slides_from_file("/slides/deck.pptx")
+    deck.mtime = 200.0
+    manager.get_slides_from_file("/slides/deck.pptx")
+
+    assert deck.loads == 2
+
+
+def test_each_call_returns_fresh_dicts(deck):
+    manager = PowerPointManager(controller=None)
+
+    first = manager.get_slides_from_file("/slides/deck.pptx")
+    first[0]["sources"].append("source-1")
+    second = manager.get_slides_from_file("/slides/deck.pptx")
+
+    assert second[0]["sources"] == []
+    assert second[0] is not first[0]
@@ -0,0 +1,61 @@
+import threading
+from pathlib import Path
+
+from src.services.project_service import ProjectService
+
+
+class FakeProject:
+    """Counts Project.save() calls instead of writing a file."""
+
+    def __init__(self, name):
+        self.project_title = name
+        self.file_path = Path(f"/projects/{name}.json")
+        self.saves = 0
+
+    def save(self):
+        self.saves += 1
+
+
+def make_service():
+    return ProjectService(source_service=None)
+
+
+def test_nested_batches_write_each_project_once():
+    service = make_service()
+    first, second = FakeProject("first"), FakeProject("second")
+
+    with service.batched_saves():
+        service.save_project(first)
+        with service.batched_saves():
+            service.save_project(first)
+            service.save_project(second)
+        service.save_project(first)
+        assert first.saves == 0
+        assert second.saves == 0
+
+    assert first.saves == 1
+    assert second.saves == 1
+
+
+def test_save_outside_a_batch_writes_immediately():
+    service = make_service()
+    project = FakeProject("project")
+
+    service.save_project(project)
+    service.save_project(project)
+
+    assert project.saves == 2
+
+
+def test_batch_only_defers_saves_from_its_own_thread():
+    service = make_service()
+    project = FakeProject("project")
+
+    with service.batched_saves():
+        worker = threading.Thread(target=service.save_project, args=(project,))
+        worker.start()
+        worker.join()
+        assert project.saves == 1
+        service.save_project(project)
+
+    assert project.saves == 2
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from src.managers.user_config_manager import UserConfigManager
+from src.models.user_config_models import RecentProject
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = UserConfigManager()
+    manager.config_dir = tmp_path
+    manager.config_file = tmp_path / "user.json"
+    manager.config.recent_projects = [
+        RecentProject(display_name=name, path=f"/projects/{name}.json")
+        for name in ("a", "b", "c")
+    ]
+    return manager
+
+
+def count_saves(manager, monkeypatch):
+    saves = []
+    original = manager.save_config
+    monkeypatch.setattr(manager, "save_config", lambda: (saves.append(1), original()))
+    return saves
+
+
+def test_remove_recent_projects_saves_once(manager, monkeypatch):
+    saves = count_saves(manager, monkeypatch)
+
+    manager.remove_recent_projects(["/projects/a.json", "/projects/c.json"])
+
+    assert [p.path for p in manager.get_recent_projects()] == ["/projects/b.json"]
+    assert len(saves) == 1
+    assert manager.config_file.exists()
+
+
+def test_concurrent_adds_are_not_lost(manager):
+    manager.clear_recent_projects()
+    threads = [
+        threading.Thread(
+            target=manager.add_recent_project, args=(f"p{i}", f"/projects/p{i}.json")
+        )
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(manager.get_recent_projects()) == 8
+
+
+def test_remove_recent_projects_skips_the_save_when_nothing_matches(manager, monkeypatch):
+    saves = count_saves(manager, monkeypatch)
+
+    manager.remove_recent_projects(["/projects/missing.json"])
+
+    assert len(manager.get_recent_projects()) == 3
+    assert saves == []
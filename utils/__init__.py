@@ -1,10 +1,23 @@
-from .citation_generator import generate_citation
-from .source_title_generator import generate_source_title
-from .validators import validate_form_data, validate_field_value, create_validated_field
+from .lazy_imports import lazy_exports
+
+# Helpers are imported lazily (PEP 562) so that packages using lazy_exports
+# do not pull in flet and the models through the validators and generators
+_LAZY_IMPORTS = {
+    "generate_citation": ".citation_generator",
+    "debounce": ".debounce",
+    "generate_source_title": ".source_title_generator",
+    "validate_form_data": ".validators",
+    "validate_field_value": ".validators",
+    "create_validated_field": ".validators",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
 
 __all__ = [
     "generate_citation",
+    "debounce",
+    "lazy_exports",
     "validate_form_data",
     "validate_field_value",
     "create_validated_field",
-]
\ No newline at end of file
+]
@@ -0,0 +1,59 @@
+"""
+Debounce Utilities
+
+This module provides a small helper for coalescing bursts of UI events
+(e.g., keystrokes in a search field) into a single call.
+"""
+
+import asyncio
+import threading
+from functools import wraps
+from typing import Callable
+
+import flet as ft
+
+
+def debounce(page: ft.Page, fn: Callable, delay: float = 0.12) -> Callable:
+    """
+    Wraps a callable so that it only runs once calls have stopped for `delay` seconds.
+
+    Each new call supersedes the pending one, so only the arguments from the last
+    call in a burst are used. The wait runs on the page's event loop (page.run_task)
+    and `fn` is called there, so it may update controls like any event handler.
+    The wrapper's `cancel()` drops the pending call, e.g. when the input it was
+    reacting to has been submitted or the user has navigated away.
+
+    Args:
+        page: The page whose event loop runs the delayed call.
+        fn: The function to debounce.
+        delay: The quiet period in seconds before `fn` is invoked.
+
+    Returns:
+        The debounced wrapper function.
+    """
+    # Bumped by every call and by cancel(); a delayed call only runs if it is still the latest
+    generation = 0
+    lock = threading.Lock()
+
+    async def fire(call_generation: int, args, kwargs):
+        await asyncio.sleep(delay)
+        with lock:
+            if call_generation != generation:
+                return
+        fn(*args, **kwargs)
+
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        nonlocal generation
+        with lock:
+            generation += 1
+            call_generation = generation
+        page.run_task(fire, call_generation, args, kwargs)
+
+    def cancel():
+        nonlocal generation
+        with lock:
+            generation += 1
+
+    wrapped.cancel = cancel
+    return wrapped
@@ -0,0 +1,48 @@
+"""
+Lazy Import Utilities
+
+This module provides the module-level __getattr__/__dir__ pair (PEP 562) used by
+packages that export names without importing their submodules up front.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Tuple
+
+
+def lazy_exports(
+    package: str,
+    module_globals: MutableMapping[str, Any],
+    mapping: Mapping[str, str],
+    import_modules: bool = False,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the __getattr__ and __dir__ functions for a lazily exporting package.
+
+    Each exported name is imported the first time it is accessed and then stored
+    in the package's globals, so later lookups never reach __getattr__ again.
+
+    Args:
+        package: The package's __name__, used to resolve relative module paths.
+        module_globals: The package's globals().
+        mapping: Exported name -> (relative) module path that defines it.
+        import_modules: If True, each name resolves to the module itself rather
+            than to the attribute of the same name inside it.
+
+    Returns:
+        The (__getattr__, __dir__) pair to assign at package level.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = mapping.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = importlib.import_module(module_name, package)
+        if not import_modules:
+            value = getattr(value, name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module_globals) | set(mapping))
+
+    return __getattr__, __dir__